@@ -8,13 +8,31 @@ Author: AI Assistant
 Version: 1.0.0
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "AI Assistant"
 
-from .core.test_agent import LocustTestAgent, TestConfig, TestResult
-from .analysis.llm_analyzer import LLMAnalyzer, MockLLMAnalyzer
 from .utils.cli import main
 
+# The agent and analyzer pull in requests and friends, so they are only imported on first access
+_LAZY_EXPORTS = {
+    'LocustTestAgent': '.core.test_agent',
+    'TestConfig': '.core.test_agent',
+    'TestResult': '.core.test_agent',
+    'LLMAnalyzer': '.analysis.llm_analyzer',
+    'MockLLMAnalyzer': '.analysis.llm_analyzer',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     'LocustTestAgent',
     'TestConfig', 
@@ -4,6 +4,21 @@ Analysis components for the Locust AI Agent.
 This module contains LLM-based analysis capabilities.
 """
 
-from .llm_analyzer import LLMAnalyzer, MockLLMAnalyzer
+import importlib
+
+# Imported on first access so that importing the package stays cheap
+_LAZY_EXPORTS = {
+    'LLMAnalyzer': '.llm_analyzer',
+    'MockLLMAnalyzer': '.llm_analyzer',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ['LLMAnalyzer', 'MockLLMAnalyzer'] 
\ No newline at end of file
@@ -3,11 +3,18 @@ LLM-based analyzer for intelligent test result analysis.
 """
 import json
 import logging
+import mmap
 import os
+import re
 from typing import Dict, List, Any, Optional
 import requests
 from dataclasses import asdict
 
+# Patterns for the stats Locust embeds in its HTML report, matched on raw bytes
+PERCENTILE_PATTERN = re.compile(rb'"response_time_percentile_0\.(\d+)":\s*(\d+\.?\d*)')
+AVG_RESPONSE_TIME_PATTERN = re.compile(rb'"avg_response_time":\s*(\d+\.?\d*)')
+NUM_FAILURES_PATTERN = re.compile(rb'"num_failures":\s*(\d+)')
+
 
 class LLMAnalyzer:
     """
@@ -29,12 +36,18 @@ class LLMAnalyzer:
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self.api_endpoint = api_endpoint or "https://api.openai.com/v1/chat/completions"
         self.model = model
+        # Keep-alive session so repeated analyses reuse the TCP/TLS connection
+        self.session = requests.Session()
         
         self.logger = logging.getLogger(__name__)
         
         if not self.api_key:
             self.logger.warning("No API key provided. LLM analysis will be disabled.")
     
+    def close(self):
+        """Close the underlying HTTP session."""
+        self.session.close()
+    
     def analyze_test_results(self, test_result: Dict[str, Any], html_report_path: str = None) -> Dict[str, Any]:
         """
         Analyze test results using LLM.
@@ -88,38 +101,35 @@ class LLMAnalyzer:
         # Add HTML report content if available
         if html_report_path:
             try:
-                with open(html_report_path, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                    # Extract key metrics from HTML
-                    context["html_metrics"] = self._extract_html_metrics(html_content)
+                with open(html_report_path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        context["html_metrics"] = {}
+                    else:
+                        # Map the report and scan it in place rather than decoding it into a str
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as html_content:
+                            context["html_metrics"] = self._extract_html_metrics(html_content)
             except Exception as e:
                 self.logger.warning(f"Could not read HTML report: {e}")
         
         return context
     
-    def _extract_html_metrics(self, html_content: str) -> Dict[str, Any]:
-        """Extract key metrics from HTML report."""
+    def _extract_html_metrics(self, html_content) -> Dict[str, Any]:
+        """Extract key metrics from HTML report bytes."""
         metrics = {}
         
         try:
-            # Look for common patterns in Locust HTML reports
-            import re
-            
             # Extract response time percentiles
-            percentile_pattern = r'"response_time_percentile_0\.(\d+)":\s*(\d+\.?\d*)'
-            percentiles = re.findall(percentile_pattern, html_content)
+            percentiles = PERCENTILE_PATTERN.findall(html_content)
             if percentiles:
                 metrics["percentiles"] = {f"p{int(p)*10}": float(v) for p, v in percentiles}
             
             # Extract request statistics
-            stats_pattern = r'"avg_response_time":\s*(\d+\.?\d*)'
-            match = re.search(stats_pattern, html_content)
+            match = AVG_RESPONSE_TIME_PATTERN.search(html_content)
             if match:
                 metrics["avg_response_time"] = float(match.group(1))
             
             # Extract failure rate
-            failure_pattern = r'"num_failures":\s*(\d+)'
-            match = re.search(failure_pattern, html_content)
+            match = NUM_FAILURES_PATTERN.search(html_content)
             if match:
                 metrics["failures"] = int(match.group(1))
             
@@ -190,7 +200,7 @@ Format your response as JSON with the following structure:
             "max_tokens": 1500
         }
         
-        response = requests.post(self.api_endpoint, headers=headers, json=data)
+        response = self.session.post(self.api_endpoint, headers=headers, json=data)
         response.raise_for_status()
         
         result = response.json()
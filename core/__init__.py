@@ -4,6 +4,22 @@ Core components for the Locust AI Agent.
 This module contains the main test agent and related data structures.
 """
 
-from .test_agent import LocustTestAgent, TestConfig, TestResult
+import importlib
+
+# Imported on first access so that importing the package stays cheap
+_LAZY_EXPORTS = {
+    'LocustTestAgent': '.test_agent',
+    'TestConfig': '.test_agent',
+    'TestResult': '.test_agent',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ['LocustTestAgent', 'TestConfig', 'TestResult'] 
\ No newline at end of file
@@ -2,7 +2,7 @@ import json
 import csv
 import random
 import re
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 from pathlib import Path
 
@@ -20,6 +20,8 @@ class EnhancedScriptGenerator:
         self.output_file = output_file
         self.scenario_data = {}
         self.data_sources = {}
+        self.regex_patterns = {}
+        self.request_constants = {}
         self.logger = logging.getLogger(__name__)
         
     def load_scenario(self):
@@ -98,45 +100,157 @@ class EnhancedScriptGenerator:
             self.logger.error(f"Error loading JSON file {file_path}: {str(e)}")
             return []
             
+    def _columnar_data(self, rows: List[Any]) -> Dict[str, tuple]:
+        """Turn a list of row dicts into one tuple per field, padding missing fields with None"""
+        rows = [row for row in rows if isinstance(row, dict)]
+        field_names = list(dict.fromkeys(field_name for row in rows for field_name in row))
+        return {field_name: tuple(row.get(field_name) for row in rows) for field_name in field_names}
+        
     def _generate_data_source_code(self) -> str:
         """Generate code for loading and managing data sources"""
-        code = """
+        source_items = ''.join(
+            f"\n        {source_name!r}: {self._columnar_data(data)!r},"
+            for source_name, data in self.data_sources.items()
+        )
+        if source_items:
+            source_items += '\n    '
+        return f"""
+    # Test data is stored column-wise and built once at import: each field maps to a
+    # tuple of values and every row shares the same index across those tuples
+    _TEST_DATA_COLUMNS = {{{source_items}}}
+    
     def load_test_data(self):
-        \"\"\"Load test data from various sources\"\"\"
-        self.test_data = {}
+        \"\"\"Pick this user's row from each test data source\"\"\"
+        self.test_data = {{}}
+        for source_name, columns in self._TEST_DATA_COLUMNS.items():
+            row_count = len(next(iter(columns.values()), ()))
+            if row_count:
+                index = self._rng.randrange(row_count)
+                self.test_data[f'{{source_name}}_current'] = {{
+                    field_name: values[index] for field_name, values in columns.items()
+                    if values[index] is not None
+                }}
 """
         
-        if self.data_sources:
-            for source_name, data in self.data_sources.items():
-                code += f"""
-        # Load {source_name} data
-        self.test_data['{source_name}'] = {repr(data)}
-"""
-                
-            code += """
-        # Randomize data for each user
-        for source_name, data in self.test_data.items():
-            if data and isinstance(data, list):
-                self.test_data[f'{source_name}_current'] = random.choice(data)
+    def _json_path_expressions(self, extract_config: Dict, assertions: List[Dict]) -> List[str]:
+        """List the JSONPath expressions a step evaluates, in extraction then assertion order"""
+        expressions = [
+            config.get('expression', '') for config in extract_config.values()
+            if config.get('type', 'json_path') == 'json_path'
+        ]
+        expressions.extend(
+            assertion.get('expression', '') for assertion in assertions if assertion.get('type') == 'json_path'
+        )
+        return expressions
+        
+    def _shared_json_paths(self, extract_config: Dict, assertions: List[Dict]) -> Dict[str, str]:
+        """Map JSONPath expressions used more than once in a step to the local holding their value"""
+        expressions = self._json_path_expressions(extract_config, assertions)
+        shared_paths = {}
+        for expression in expressions:
+            if expression not in shared_paths and expressions.count(expression) > 1:
+                shared_paths[expression] = f'json_path_value_{len(shared_paths) + 1}'
+        return shared_paths
+        
+    def _status_guards_json_paths(self, extract_config: Dict, assertions: List[Dict]) -> bool:
+        """Check whether every JSONPath in a step belongs to an assertion behind a status code check"""
+        return (
+            any(assertion.get('type') == 'status_code' for assertion in assertions)
+            and not any(config.get('type', 'json_path') == 'json_path' for config in extract_config.values())
+        )
+        
+    def _generate_response_parsing_code(self, extract_config: Dict, assertions: List[Dict],
+                                        shared_paths: Optional[Dict[str, str]] = None) -> str:
+        """Generate code that parses the JSON response body once per step"""
+        if not self._json_path_expressions(extract_config, assertions):
+            return ""
+            
+        code = """
+        # Parse the response body once for extraction and assertions
+        try:
+            response_data = json_loads(response.content)
+        except (ValueError, TypeError):
+            response_data = None
 """
-        else:
+        if shared_paths:
             code += """
-        # No data sources defined - using empty test data
-        pass
+        # Evaluate JSONPaths used by both extraction and assertions once
 """
-        
+            for expression, local_name in shared_paths.items():
+                code += self._generate_json_path_code(local_name, expression, ' ' * 8)
         return code
         
-    def _generate_extraction_code(self, extract_config: Dict) -> str:
+    def _split_json_path(self, expression: str) -> Optional[List[str]]:
+        """Split a JSONPath expression into keys, indexes and [*] wildcards, or None if it can't be inlined"""
+        if not expression.startswith('$.'):
+            return None
+        parts = []
+        # Bracketed indexes such as results[0] are plain numeric segments
+        for segment in re.sub(r'\[(\d+)\]', r'.\1', expression[2:]).split('.'):
+            if segment.endswith('[*]'):
+                segment = segment[:-3]
+                if segment:
+                    parts.append(segment)
+                parts.append('[*]')
+            elif segment:
+                parts.append(segment)
+        for i, part in enumerate(parts):
+            if part == '[*]':
+                # A wildcard maps the following key over the list, so it can't be followed by another wildcard
+                if i + 1 < len(parts) and parts[i + 1] == '[*]':
+                    return None
+            elif '[' in part or ']' in part:
+                return None
+        return parts
+        
+    def _generate_json_path_code(self, target: str, expression: str, indent: str,
+                                 shared_paths: Optional[Dict[str, str]] = None) -> str:
+        """Generate straight-line code that evaluates a JSONPath expression into target"""
+        if shared_paths and expression in shared_paths:
+            return f"{indent}{target} = {shared_paths[expression]}\n"
+        parts = self._split_json_path(expression)
+        if not parts:
+            return f"{indent}{target} = self._extract_json_path(response_data, '{expression}')\n"
+        
+        lines = []
+        source = 'response_data'
+        i = 0
+        while i < len(parts):
+            part = parts[i]
+            if part.isdigit():
+                # Numeric parts index into lists but are still plain keys on dicts
+                index = int(part)
+                lines.append(
+                    f"{target} = {source}.get({part!r}) if isinstance({source}, dict) "
+                    f"else {source}[{index}] if isinstance({source}, list) and len({source}) > {index} else None"
+                )
+            elif part != '[*]':
+                lines.append(f"{target} = {source}.get({part!r}) if isinstance({source}, dict) else None")
+            elif i + 1 == len(parts):
+                lines.append(f"{target} = {source} if isinstance({source}, list) else None")
+            else:
+                next_part = parts[i + 1]
+                lines.append(
+                    f"{target} = [item.get({next_part!r}) for item in {source} "
+                    f"if isinstance(item, dict) and {next_part!r} in item] if isinstance({source}, list) else None"
+                )
+                i += 1
+            source = target
+            i += 1
+        return ''.join(f"{indent}{line}\n" for line in lines)
+        
+    def _generate_extraction_code(self, extract_config: Dict, shared_paths: Optional[Dict[str, str]] = None) -> str:
         """Generate code for extracting variables from responses"""
         if not extract_config:
             return ""
             
         code = """
-        # Extract variables from response
+        # Extract variables from response, binding this user's stores once for the whole step
         try:
-            response_data = response.json()
+            variables = self.variables
+            array_values = self.array_values
 """
+        header_length = len(code)
         
         for var_name, config in extract_config.items():
             extract_type = config.get('type', 'json_path')
@@ -146,8 +260,7 @@ class EnhancedScriptGenerator:
             if extract_type == 'json_path':
                 code += f"""
             # Extract {var_name} using JSONPath: {expression}
-            {var_name}_value = self._extract_json_path(response_data, '{expression}')
-            if {var_name}_value is not None:
+{self._generate_json_path_code(f'{var_name}_value', expression, ' ' * 12, shared_paths)}            if {var_name}_value is not None:
 """
                 if transform:
                     code += f"""
@@ -155,20 +268,30 @@ class EnhancedScriptGenerator:
                 {var_name}_value = self._apply_transform({var_name}_value, '{transform}')
 """
                 code += f"""
-                # Store as JSON if it's an array, otherwise as string
+                # Keep arrays as lists for the random helpers, store everything else as a string
                 if isinstance({var_name}_value, list):
-                    self.variables['{var_name}'] = json.dumps({var_name}_value)
-                    self.logger.info(f'Extracted array {var_name} with {{len({var_name}_value)}} items')
+                    variables['{var_name}'] = {var_name}_value
+                    array_values['{var_name}'] = tuple(map(str, {var_name}_value))
+                    if info_enabled:
+                        logger.info('Extracted array {var_name} with %d items', len({var_name}_value))
                 else:
-                    self.variables['{var_name}'] = str({var_name}_value)
-                    self.logger.info(f'Extracted {var_name} = {{self.variables["{var_name}"]}}')
+                    variables['{var_name}'] = str({var_name}_value)
+                    array_values.pop('{var_name}', None)
+                    if info_enabled:
+                        logger.info('Extracted {var_name} = %s', variables['{var_name}'])
             else:
-                self.logger.warning(f'Failed to extract {var_name} using JSONPath: {expression}')
+                logger.warning({f'Failed to extract {var_name} using JSONPath: {expression}'!r})
 """
             elif extract_type == 'regex':
+                # Resolve the capture group now so the step only does the search
+                try:
+                    group_index = 1 if re.compile(expression).groups else 0
+                except re.error:
+                    group_index = 0
                 code += f"""
             # Extract {var_name} using regex: {expression}
-            {var_name}_value = self._extract_regex(response.text, r'{expression}')
+            {var_name}_match = {self.regex_patterns[expression]}.search(response.text)
+            {var_name}_value = {var_name}_match.group({group_index}) if {var_name}_match else None
             if {var_name}_value:
 """
                 if transform:
@@ -177,17 +300,19 @@ class EnhancedScriptGenerator:
                 {var_name}_value = self._apply_transform({var_name}_value, '{transform}')
 """
                 code += f"""
-                self.variables['{var_name}'] = {var_name}_value
-                self.logger.info(f'Extracted {var_name} = {{self.variables["{var_name}"]}}')
+                variables['{var_name}'] = {var_name}_value
+                array_values.pop('{var_name}', None)
+                if info_enabled:
+                    logger.info('Extracted {var_name} = %s', variables['{var_name}'])
             else:
-                self.logger.warning(f'Failed to extract {var_name} using regex: {expression}')
+                logger.warning({f'Failed to extract {var_name} using regex: {expression}'!r})
 """
             elif extract_type == 'boundary':
                 left_boundary = config.get('left_boundary', '')
                 right_boundary = config.get('right_boundary', '')
                 code += f"""
             # Extract {var_name} using boundaries: '{left_boundary}' -> '{right_boundary}'
-            {var_name}_value = self._extract_boundary(response.text, '{left_boundary}', '{right_boundary}')
+            {var_name}_value = self._extract_boundary(response.content, {left_boundary.encode('utf-8')!r}, {right_boundary.encode('utf-8')!r})
             if {var_name}_value:
 """
                 if transform:
@@ -196,131 +321,193 @@ class EnhancedScriptGenerator:
                 {var_name}_value = self._apply_transform({var_name}_value, '{transform}')
 """
                 code += f"""
-                self.variables['{var_name}'] = {var_name}_value
-                self.logger.info(f'Extracted {var_name} = {{self.variables["{var_name}"]}}')
+                variables['{var_name}'] = {var_name}_value
+                array_values.pop('{var_name}', None)
+                if info_enabled:
+                    logger.info('Extracted {var_name} = %s', variables['{var_name}'])
             else:
-                self.logger.warning(f'Failed to extract {var_name} using boundaries: {left_boundary} -> {right_boundary}')
+                logger.warning({f'Failed to extract {var_name} using boundaries: {left_boundary} -> {right_boundary}'!r})
+"""
+        
+        if len(code) == header_length:
+            code += """
+            pass
 """
         
         code += """
         except Exception as e:
-            self.logger.error(f'Error extracting variables: {{str(e)}}')
+            logger.error('Error extracting variables: %s', e)
 """
         
         return code
         
-    def _generate_assertion_code(self, assertions: List[Dict]) -> str:
-        """Generate code for running assertions"""
+    def _generate_assertion_code(self, assertions: List[Dict], shared_paths: Optional[Dict[str, str]] = None,
+                                 body_parsing_code: str = "") -> str:
+        """Generate code for running assertions, parsing the body inside the status check when given"""
         if not assertions:
             return ""
             
         code = """
-        # Run assertions
-        assertion_failures = []
+        # Run assertions, reusing this user's failure list instead of allocating one per step;
+        # failures are (template, args) pairs that are only formatted when reported
+        assertion_failures = self._assertion_failures
+        assertion_failures.clear()
+"""
+        assertion_types = {assertion.get('type', '') for assertion in assertions}
+        if 'status_code' in assertion_types:
+            code += """        status_code = response.status_code
+"""
+        if 'response_time_ms' in assertion_types:
+            code += """        elapsed_ms = response.elapsed.total_seconds() * 1000
 """
         
-        for assertion in assertions:
-            assertion_type = assertion.get('type', '')
-            description = assertion.get('description', f'{assertion_type} assertion')
-            
-            if assertion_type == 'status_code':
-                expected = assertion.get('expected', 200)
-                code += f"""
+        # Status and timing checks don't touch the body, so they run first; body assertions
+        # only run once every status check passed and a bad status is reported on its own
+        header_types = ('status_code', 'response_time_ms')
+        code += ''.join(
+            self._generate_single_assertion_code(assertion, shared_paths)
+            for assertion in assertions if assertion.get('type', '') in header_types
+        )
+        body_code = body_parsing_code + ''.join(
+            self._generate_single_assertion_code(assertion, shared_paths)
+            for assertion in assertions if assertion.get('type', '') not in header_types
+        )
+        expected_statuses = list(dict.fromkeys(
+            assertion.get('expected', 200) for assertion in assertions if assertion.get('type') == 'status_code'
+        ))
+        if body_code and expected_statuses:
+            if len(expected_statuses) == 1:
+                status_check = f'status_code == {expected_statuses[0]}'
+            else:
+                # A response can only match one of several expected codes, so any of them lets the body be checked
+                status_check = f"status_code in ({', '.join(map(str, expected_statuses))})"
+            body_code = '\n'.join('    ' + line if line.strip() else line for line in body_code.split('\n'))
+            code += f"""
+        # Body assertions
+        if {status_check}:{body_code}"""
+        else:
+            code += body_code
+        
+        code += """
+        # Report assertion failures
+        if assertion_failures:
+            failure_message = 'Assertions failed: ' + '; '.join(template % args for template, args in assertion_failures)
+            response.failure(failure_message)
+            logger.error(failure_message)
+        elif info_enabled:
+            logger.info('All assertions passed')
+"""
+        
+        return code
+        
+    def _escape_template(self, value: Any) -> str:
+        """Escape '%' so scenario text can be embedded in a %-style failure template"""
+        return str(value).replace('%', '%%')
+        
+    def _failure_entry(self, template: str, *args_code: str) -> str:
+        """Generate a (template, args) failure entry that is only formatted if the failure is reported"""
+        args = f"({', '.join(args_code)},)" if args_code else "()"
+        return f"({template!r}, {args})"
+        
+    def _generate_single_assertion_code(self, assertion: Dict, shared_paths: Optional[Dict[str, str]] = None) -> str:
+        """Generate the check for one assertion, appending to assertion_failures when it fails"""
+        code = ""
+        assertion_type = assertion.get('type', '')
+        description = assertion.get('description', f'{assertion_type} assertion')
+        # Failure templates are %-style, so scenario text is escaped before it is embedded
+        message = self._escape_template(description)
+        
+        if assertion_type == 'status_code':
+            expected = assertion.get('expected', 200)
+            code += f"""
         # Status code assertion
-        if response.status_code != {expected}:
-            assertion_failures.append(f'{description}: expected {expected}, got {{response.status_code}}')
+        if status_code != {expected}:
+            assertion_failures.append({self._failure_entry(f'{message}: expected {expected}, got %s', 'status_code')})
 """
-                
-            elif assertion_type == 'response_time_ms':
-                max_time = assertion.get('max', 5000)
-                code += f"""
+            
+        elif assertion_type == 'response_time_ms':
+            max_time = assertion.get('max', 5000)
+            code += f"""
         # Response time assertion
-        if response.elapsed.total_seconds() * 1000 > {max_time}:
-            assertion_failures.append(f'{description}: response time {{response.elapsed.total_seconds() * 1000:.0f}}ms exceeds {max_time}ms')
+        if elapsed_ms > {max_time}:
+            assertion_failures.append({self._failure_entry(f'{message}: response time %.0fms exceeds {max_time}ms', 'elapsed_ms')})
 """
-                
-            elif assertion_type == 'json_path':
-                expression = assertion.get('expression', '')
-                expected = assertion.get('expected')
-                min_val = assertion.get('min')
-                max_val = assertion.get('max')
-                
-                code += f"""
+            
+        elif assertion_type == 'json_path':
+            expression = assertion.get('expression', '')
+            expected = assertion.get('expected')
+            min_val = assertion.get('min')
+            max_val = assertion.get('max')
+            
+            code += f"""
         # JSONPath assertion: {expression}
         try:
-            json_value = self._extract_json_path(response.json(), '{expression}')
-            if json_value is not None:
+{self._generate_json_path_code('json_value', expression, ' ' * 12, shared_paths)}            if json_value is not None:
 """
-                
-                # Add conditions if they exist
-                has_conditions = False
-                if expected is not None:
-                    code += f"""
+            
+            # Add conditions if they exist
+            has_conditions = False
+            if expected is not None:
+                code += f"""
                 if json_value != {repr(expected)}:
-                    assertion_failures.append(f'{description}: expected {repr(expected)}, got {{json_value}}')
+                    assertion_failures.append({self._failure_entry(f'{message}: expected {self._escape_template(repr(expected))}, got %s', 'json_value')})
 """
-                    has_conditions = True
+                has_conditions = True
+            if min_val is not None or max_val is not None:
+                # Bounds are literals in the generated code; lists are checked by length
+                # and the type check is shared between the min and max comparisons
+                list_checks = ''
+                value_checks = ''
                 if min_val is not None:
-                    code += f"""
-                # Handle min comparison - check length if it's a list, otherwise compare directly
-                if isinstance(json_value, list):
+                    list_checks += f"""
                     if len(json_value) < {min_val}:
-                        assertion_failures.append(f'{description}: list has {{len(json_value)}} items, which is below minimum {min_val}')
-                else:
+                        assertion_failures.append({self._failure_entry(f'{message}: list has %d items, which is below minimum {min_val}', 'len(json_value)')})"""
+                    value_checks += f"""
                     if json_value < {min_val}:
-                        assertion_failures.append(f'{description}: value {{json_value}} is below minimum {min_val}')
-"""
-                    has_conditions = True
+                        assertion_failures.append({self._failure_entry(f'{message}: value %s is below minimum {min_val}', 'json_value')})"""
                 if max_val is not None:
-                    code += f"""
-                # Handle max comparison - check length if it's a list, otherwise compare directly
-                if isinstance(json_value, list):
+                    list_checks += f"""
                     if len(json_value) > {max_val}:
-                        assertion_failures.append(f'{description}: list has {{len(json_value)}} items, which exceeds maximum {max_val}')
-                else:
+                        assertion_failures.append({self._failure_entry(f'{message}: list has %d items, which exceeds maximum {max_val}', 'len(json_value)')})"""
+                    value_checks += f"""
                     if json_value > {max_val}:
-                        assertion_failures.append(f'{description}: value {{json_value}} exceeds maximum {max_val}')
+                        assertion_failures.append({self._failure_entry(f'{message}: value %s exceeds maximum {max_val}', 'json_value')})"""
+                code += f"""
+                # Handle min/max comparison - check length if it's a list, otherwise compare directly
+                if isinstance(json_value, list):{list_checks}
+                else:{value_checks}
 """
-                    has_conditions = True
-                
-                # If no conditions were added, add a simple validation
-                if not has_conditions:
-                    code += f"""
+                has_conditions = True
+            
+            # If no conditions were added, add a simple validation
+            if not has_conditions:
+                code += f"""
                 # JSONPath value exists and is valid
-                self.logger.info(f'JSONPath assertion passed: {{json_value}}')
+                if info_enabled:
+                    logger.info('JSONPath assertion passed: %s', json_value)
 """
-                
-                code += f"""
+            
+            code += f"""
             else:
-                assertion_failures.append(f'{description}: JSONPath expression returned None')
+                assertion_failures.append({self._failure_entry(f'{message}: JSONPath expression returned None')})
         except Exception as e:
-            assertion_failures.append(f'{description}: error evaluating JSONPath - {{str(e)}}')
+            assertion_failures.append({self._failure_entry(f'{message}: error evaluating JSONPath - %s', 'e')})
 """
-                
-            elif assertion_type == 'body_contains_text':
-                text = assertion.get('text', '')
-                code += f"""
+            
+        elif assertion_type == 'body_contains_text':
+            text = assertion.get('text', '')
+            code += f"""
         # Body contains text assertion
-        if '{text}' not in response.text:
-            assertion_failures.append(f'{description}: response does not contain text "{text}"')
+        if {text!r} not in response.text:
+            assertion_failures.append({self._failure_entry(f'{message}: response does not contain text "{self._escape_template(text)}"')})
 """
-                
-            elif assertion_type == 'regex':
-                pattern = assertion.get('pattern', '')
-                code += f"""
+            
+        elif assertion_type == 'regex':
+            pattern = assertion.get('pattern', '')
+            code += f"""
         # Regex assertion
-        if not re.search(r'{pattern}', response.text):
-            assertion_failures.append(f'{description}: response does not match pattern "{pattern}"')
-"""
-        
-        code += """
-        # Report assertion failures
-        if assertion_failures:
-            failure_message = '; '.join(assertion_failures)
-            response.failure(f'Assertions failed: {failure_message}')
-            self.logger.error(f'Assertions failed: {failure_message}')
-        else:
-            self.logger.info('All assertions passed')
+        if not {self.regex_patterns[pattern]}.search(response.text):
+            assertion_failures.append({self._failure_entry(f'{message}: response does not match pattern "{self._escape_template(pattern)}"')})
 """
         
         return code
@@ -328,110 +515,97 @@ class EnhancedScriptGenerator:
     def _generate_helper_methods(self) -> str:
         """Generate helper methods for extraction and utilities"""
         return """
+    def _compile_json_path(self, expression):
+        \"\"\"Compile a JSONPath-like expression into a tuple of (operation, argument) steps\"\"\"
+        # Skip the '$.' prefix, give every [*] its own part and treat [0] like .0
+        path = re.sub(r'\\[(\\d+)\\]', r'.\\1', expression[2:])
+        parts = [part for part in path.replace('[*]', '.[*].').split('.') if part]
+        
+        operations = []
+        i = 0
+        while i < len(parts):
+            part = parts[i]
+            if part == '[*]':
+                if i + 1 == len(parts):
+                    # A trailing wildcard returns the array itself
+                    operations.append(('all', None))
+                else:
+                    # Otherwise the next property is extracted from each item
+                    operations.append(('map', parts[i + 1]))
+                    i += 1
+            elif part.isdigit():
+                operations.append(('index', (part, int(part))))
+            else:
+                operations.append(('key', part))
+            i += 1
+        return tuple(operations)
+    
     def _extract_json_path(self, data, expression):
         \"\"\"Extract value using JSONPath-like expression\"\"\"
         try:
             if not expression.startswith('$'):
                 return None
-                
-            # Split the path more intelligently to handle [*] syntax
-            parts = []
-            current_part = ""
-            i = 2  # Skip the '$.' prefix
-            while i < len(expression):
-                char = expression[i]
-                if char == '.':
-                    if current_part:
-                        parts.append(current_part)
-                        current_part = ""
-                elif char == '[' and i + 2 < len(expression) and expression[i:i+3] == '[*]':
-                    if current_part:
-                        parts.append(current_part)
-                    parts.append('[*]')
-                    current_part = ""
-                    i += 2  # Skip the '[*]'
-                else:
-                    current_part += char
-                i += 1
-            if current_part:
-                parts.append(current_part)
+            # Each expression is compiled once and reused by every user
+            operations = JSON_PATH_CACHE.get(expression)
+            if operations is None:
+                operations = JSON_PATH_CACHE.setdefault(expression, self._compile_json_path(expression))
+            # Parsed JSON only holds plain dicts and lists, so exact type checks are enough
+            dict_type = dict
+            list_type = list
             current = data
-            i = 0
-            print(f'DEBUG: JSONPath extraction: {expression}')
-            print(f'DEBUG: Parsed parts: {parts}')
-            print(f'DEBUG: Input data type: {type(data)}')
-            if isinstance(data, dict):
-                print(f'DEBUG: Available keys: {list(data.keys())}')
-            elif isinstance(data, list):
-                print(f'DEBUG: Array length: {len(data)}')
-            while i < len(parts):
-                part = parts[i]
-                print(f'DEBUG: Processing part {i+1}: {part}, current type: {type(current)}')
-                if isinstance(current, dict):
-                    if part in current:
-                        current = current[part]
-                        print(f'DEBUG: Found key {part}, new current type: {type(current)}')
-                    else:
-                        print(f'DEBUG: Key {part} not found in dict. Available keys: {list(current.keys())}')
+            for operation, argument in operations:
+                current_type = type(current)
+                if operation == 'key':
+                    if current_type is not dict_type:
+                        logger.debug('JSONPath %s: cannot read key %s from %s', expression, argument, current_type)
+                        return None
+                    try:
+                        current = current[argument]
+                    except KeyError:
+                        logger.debug('JSONPath %s: key %s not found', expression, argument)
+                        return None
+                elif operation == 'map':
+                    if current_type is not list_type:
+                        logger.debug('JSONPath %s: cannot apply wildcard to %s', expression, current_type)
                         return None
-                elif isinstance(current, list):
-                    if part == '[*]':
-                        # If this is the last part, just return the array
-                        if i + 1 == len(parts):
-                            print(f'DEBUG: Wildcard found, returning array with {len(current)} items')
-                            return current
-                        # Otherwise, extract the next property from each item and continue
-                        next_part = parts[i + 1]
-                        print(f'DEBUG: Extracting property {next_part} from each array item')
-                        current = [item.get(next_part) for item in current if isinstance(item, dict) and next_part in item]
-                        print(f'DEBUG: Extracted {next_part} from {len(current)} items')
-                        i += 1  # Skip the next part, since we've just processed it
-                    elif part.isdigit():
-                        index = int(part)
-                        if 0 <= index < len(current):
-                            current = current[index]
-                            print(f'DEBUG: Accessed index {index}, new current type: {type(current)}')
-                        else:
-                            print(f'DEBUG: Index {index} out of range for array of length {len(current)}')
+                    current = [item[argument] for item in current if type(item) is dict_type and argument in item]
+                elif operation == 'index':
+                    key, index = argument
+                    if current_type is dict_type:
+                        try:
+                            current = current[key]
+                        except KeyError:
+                            logger.debug('JSONPath %s: key %s not found', expression, key)
                             return None
+                    elif current_type is list_type and 0 <= index < len(current):
+                        current = current[index]
                     else:
-                        print(f'DEBUG: Invalid part {part} for array type')
+                        logger.debug('JSONPath %s: index %d not available on %s', expression, index, current_type)
                         return None
                 else:
-                    print(f'DEBUG: Cannot process part {part} on type {type(current)}')
-                    return None
-                i += 1
-            print(f'DEBUG: Final result: {current}')
+                    # A trailing wildcard only applies to arrays
+                    return current if current_type is list_type else None
             return current
         except Exception as e:
-            print(f'DEBUG: Error extracting JSONPath {expression}: {str(e)}')
-            self.logger.error(f'Error extracting JSONPath {expression}: {{str(e)}}')
-            return None
-            
-    def _extract_regex(self, text, pattern):
-        \"\"\"Extract value using regex pattern\"\"\"
-        try:
-            match = re.search(pattern, text)
-            return match.group(1) if match and match.groups() else match.group(0) if match else None
-        except Exception as e:
-            self.logger.error(f'Error extracting regex {pattern}: {{str(e)}}')
+            logger.error('Error extracting JSONPath %s: %s', expression, e)
             return None
             
-    def _extract_boundary(self, text, left_boundary, right_boundary):
-        \"\"\"Extract value between left and right boundaries\"\"\"
+    def _extract_boundary(self, content, left_boundary, right_boundary):
+        \"\"\"Extract value between left and right boundaries in the raw response body\"\"\"
         try:
-            start = text.find(left_boundary)
+            start = content.find(left_boundary)
             if start == -1:
                 return None
             start += len(left_boundary)
             
-            end = text.find(right_boundary, start)
+            end = content.find(right_boundary, start)
             if end == -1:
                 return None
                 
-            return text[start:end].strip()
+            # Only the matched slice is decoded, never the whole body
+            return str(memoryview(content)[start:end], 'utf-8', 'replace').strip()
         except Exception as e:
-            self.logger.error(f'Error extracting boundary: {{str(e)}}')
+            logger.error('Error extracting boundary: %s', e)
             return None
             
     def _get_test_data_value(self, source_name, field_name):
@@ -442,99 +616,119 @@ class EnhancedScriptGenerator:
                 return current_data.get(field_name)
             return None
         except Exception as e:
-            self.logger.error(f'Error getting test data value: {{str(e)}}')
+            logger.error('Error getting test data value: %s', e)
             return None
             
     def _replace_dynamic_functions(self, text):
         \"\"\"Replace dynamic function calls in text\"\"\"
-        try:
-            # Handle random(min, max) function
-            random_pattern = r'\\{\\{random\\(([^,]+),\\s*([^)]+)\\)\\}\\}'
-            def replace_random(match):
-                min_val = match.group(1).strip()
-                max_val = match.group(2).strip()
-                # Try to resolve variables in min/max values
-                min_val = self._resolve_single_value(min_val)
-                max_val = self._resolve_single_value(max_val)
-                try:
-                    min_int = int(min_val)
-                    max_int = int(max_val)
-                    return str(random.randint(min_int, max_int))
-                except (ValueError, TypeError):
-                    return '1'  # fallback
-            text = re.sub(random_pattern, replace_random, text)
-            
-            # Handle random_from_array(array_var) function
-            random_array_pattern = r'\\{\\{random_from_array\\(([^)]+)\\)\\}\\}'
-            def replace_random_array(match):
-                array_var = match.group(1).strip()
-                if array_var in self.variables:
-                    try:
-                        # Try to parse as JSON array first
-                        array_data = json.loads(self.variables[array_var])
-                        if isinstance(array_data, list) and array_data:
-                            return str(random.choice(array_data))
-                    except (json.JSONDecodeError, TypeError):
-                        # If not JSON, try to split by comma (fallback)
-                        try:
-                            array_str = self.variables[array_var]
-                            if ',' in array_str:
-                                array_data = [item.strip() for item in array_str.split(',')]
-                                if array_data:
-                                    return str(random.choice(array_data))
-                        except:
-                            pass
-                return '1'  # fallback
-            text = re.sub(random_array_pattern, replace_random_array, text)
-            
-            # Handle random_subset_from_array(array_var, n) function
-            random_subset_pattern = r'\\{\\{random_subset_from_array\\(([^,]+),\\s*([^)]+)\\)\\}\\}'
-            def replace_random_subset(match):
-                array_var = match.group(1).strip()
-                n_val = match.group(2).strip()
-                n_val = self._resolve_single_value(n_val)
-                try:
-                    n = int(n_val)
-                except (ValueError, TypeError):
-                    n = 1
-                
-                if array_var in self.variables:
-                    try:
-                        array_data = json.loads(self.variables[array_var])
-                        if isinstance(array_data, list) and array_data:
-                            subset = random.sample(array_data, min(n, len(array_data)))
-                            # Return comma-separated values for URL usage instead of JSON array
-                            return ','.join(map(str, subset))
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-                return ''  # fallback
-            text = re.sub(random_subset_pattern, replace_random_subset, text)
-            
-            # Handle random_index_from_array(array_var) function
-            random_index_pattern = r'\\{\\{random_index_from_array\\(([^)]+)\\)\\}\\}'
-            def replace_random_index(match):
-                array_var = match.group(1).strip()
-                if array_var in self.variables:
-                    try:
-                        array_data = json.loads(self.variables[array_var])
-                        if isinstance(array_data, list) and array_data:
-                            return str(random.randint(0, len(array_data) - 1))
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-                return '0'  # fallback
-            text = re.sub(random_index_pattern, replace_random_index, text)
-            
+        if not text or '{{' not in text:
             return text
+        try:
+            # All dynamic functions are matched in a single pass and dispatched by name
+            return DYNAMIC_FUNCTION_RE.sub(self._call_dynamic_function, text)
         except Exception as e:
-            self.logger.error(f'Error replacing dynamic functions: {{str(e)}}')
+            logger.error('Error replacing dynamic functions: %s', e)
             return text
     
-    def _resolve_single_value(self, value):
-        \"\"\"Resolve a single value, handling variable references\"\"\"
-        if value in self.variables:
-            return self.variables[value]
-        return value
+    def _call_dynamic_function(self, match):
+        \"\"\"Evaluate one dynamic function call, leaving malformed calls untouched\"\"\"
+        function_name, args = match.group(1), match.group(2)
+        if function_name in ('random', 'random_subset_from_array'):
+            first, separator, second = args.partition(',')
+            if not separator or not first or not second:
+                return match.group(0)
+            args = (first.strip(), second.strip())
+        else:
+            if not args:
+                return match.group(0)
+            args = (args.strip(),)
+        return self._DYNAMIC_FUNCTIONS[function_name](self, *args)
+    
+    def _random(self, min_val, max_val):
+        \"\"\"Handle random(min, max) function\"\"\"
+        # Either bound may name an extracted variable
+        variables = self.variables
+        min_val = variables.get(min_val, min_val)
+        max_val = variables.get(max_val, max_val)
+        try:
+            min_int = int(min_val)
+            max_int = int(max_val)
+            return str(self._rng.randrange(min_int, max_int + 1))
+        except (ValueError, TypeError):
+            return '1'  # fallback
+    
+    def _random_from_array(self, array_var):
+        \"\"\"Handle random_from_array(array_var) function\"\"\"
+        if array_var in self.variables:
+            try:
+                # Try to parse as JSON array first
+                array_data = self._get_array_variable(array_var)
+                if array_data:
+                    return self._rng.choice(array_data)
+            except (json.JSONDecodeError, TypeError):
+                # If not JSON, try to split by comma (fallback)
+                try:
+                    array_str = self.variables[array_var]
+                    if ',' in array_str:
+                        array_data = [item.strip() for item in array_str.split(',')]
+                        if array_data:
+                            return str(self._rng.choice(array_data))
+                except:
+                    pass
+        return '1'  # fallback
+    
+    def _random_subset_from_array(self, array_var, n_val):
+        \"\"\"Handle random_subset_from_array(array_var, n) function\"\"\"
+        if type(n_val) is int:
+            n = n_val
+        else:
+            n_val = self.variables.get(n_val, n_val)
+            try:
+                n = int(n_val)
+            except (ValueError, TypeError):
+                n = 1
         
+        if array_var in self.variables:
+            try:
+                array_data = self._get_array_variable(array_var)
+                if array_data:
+                    subset = self._rng.sample(array_data, min(n, len(array_data)))
+                    # Return comma-separated values for URL usage instead of JSON array
+                    return ','.join(subset)
+            except (json.JSONDecodeError, TypeError):
+                pass
+        return ''  # fallback
+    
+    def _random_index_from_array(self, array_var):
+        \"\"\"Handle random_index_from_array(array_var) function\"\"\"
+        if array_var in self.variables:
+            try:
+                array_data = self._get_array_variable(array_var)
+                if array_data:
+                    return str(self._rng.randrange(len(array_data)))
+            except (json.JSONDecodeError, TypeError):
+                pass
+        return '0'  # fallback
+    
+    def _get_array_variable(self, array_var):
+        \"\"\"Return an array variable as a tuple of strings, converting it once per extraction\"\"\"
+        array_values = self.array_values.get(array_var)
+        if array_values is None:
+            array_data = self.variables[array_var]
+            if not isinstance(array_data, list):
+                array_data = json_loads(array_data)
+            # Values that aren't JSON arrays convert to an empty tuple so callers use their fallback
+            array_values = tuple(map(str, array_data)) if isinstance(array_data, list) else ()
+            self.array_values[array_var] = array_values
+        return array_values
+    
+    _DYNAMIC_FUNCTIONS = {
+        'random': _random,
+        'random_from_array': _random_from_array,
+        'random_subset_from_array': _random_subset_from_array,
+        'random_index_from_array': _random_index_from_array,
+    }
+    
     def _apply_transform(self, value, transform_name):
         \"\"\"Apply custom transformation to extracted value\"\"\"
         try:
@@ -543,18 +737,159 @@ class EnhancedScriptGenerator:
             # Add more transformations as needed
             return value
         except Exception as e:
-            self.logger.error(f'Error applying transform {transform_name}: {{str(e)}}')
+            logger.error('Error applying transform %s: %s', transform_name, e)
             return value
             
     def _extract_page_number(self, url):
         \"\"\"Extract page number from next URL\"\"\"
-        if url and 'page=' in url:
-            match = re.search(r'page=(\\d+)', url)
-            if match:
-                return int(match.group(1))
+        if not url:
+            return 1
+        # Scan for the digits after 'page=' directly instead of running a regex
+        start = url.find('page=')
+        while start != -1:
+            start += 5
+            end = start
+            while end < len(url) and url[end] in '0123456789':
+                end += 1
+            if end > start:
+                return int(url[start:end])
+            start = url.find('page=', start)
         return 1
 """
         
+    def _is_template(self, value: Any) -> bool:
+        """Check whether a value contains placeholders or dynamic functions"""
+        return '{' in str(value)
+        
+    def _step_headers(self, step: Dict) -> Dict[str, Any]:
+        """Return the request headers sent by a step, including the default Accept header"""
+        # requests only accepts str header values, so numbers and booleans from the config are converted here
+        headers = {header_name: str(header_value) for header_name, header_value in step.get('headers', {}).items()}
+        headers['Accept'] = 'application/json'
+        return headers
+        
+    def _has_template(self, value: Any) -> bool:
+        """Check whether any string inside a request value contains placeholders or dynamic functions"""
+        if isinstance(value, dict):
+            return any(self._has_template(key) or self._has_template(item) for key, item in value.items())
+        if isinstance(value, list):
+            return any(self._has_template(item) for item in value)
+        return isinstance(value, str) and self._is_template(value)
+        
+    def _collect_request_constants(self, steps: List[Dict]) -> Dict[Tuple[str, str], str]:
+        """Name placeholder-free headers, params and bodies so each is built once at import"""
+        request_constants = {}
+        for step in steps:
+            candidates = (
+                ('STATIC_HEADERS', self._step_headers(step)),
+                ('STATIC_PARAMS', step.get('params')),
+                ('STATIC_BODY', step.get('body')),
+            )
+            for prefix, value in candidates:
+                if not value or self._has_template(value):
+                    continue
+                key = (prefix, repr(value))
+                if key not in request_constants:
+                    count = sum(name.startswith(prefix + '_') for name in request_constants.values())
+                    request_constants[key] = f'{prefix}_{count + 1}'
+        return request_constants
+        
+    def _collect_regex_patterns(self, steps: List[Dict]) -> Dict[str, str]:
+        """Name every regex used by extractions and assertions so it can be compiled once at import"""
+        regex_patterns = {}
+        for step in steps:
+            patterns = [
+                config.get('expression', '') for config in step.get('extract', {}).values()
+                if config.get('type', 'json_path') == 'regex'
+            ]
+            patterns.extend(
+                assertion.get('pattern', '') for assertion in step.get('assertions', [])
+                if assertion.get('type') == 'regex'
+            )
+            for pattern in patterns:
+                if pattern not in regex_patterns:
+                    regex_patterns[pattern] = f'REGEX_PATTERN_{len(regex_patterns) + 1}'
+        return regex_patterns
+        
+    def _generate_dynamic_call_code(self, template: str) -> Optional[str]:
+        """Generate a direct helper call when a template is exactly one dynamic function call"""
+        match = re.fullmatch(
+            r'\{\{(random|random_from_array|random_subset_from_array|random_index_from_array)\(([^)]*)\)\}\}',
+            template
+        )
+        if not match:
+            return None
+        function_name, args = match.group(1), match.group(2)
+        if function_name in ('random', 'random_subset_from_array'):
+            first, separator, second = args.partition(',')
+            if not separator or not first or not second:
+                return None
+            args = (first.strip(), second.strip())
+            if function_name == 'random' and all(arg.isdigit() for arg in args) and int(args[0]) <= int(args[1]):
+                # Constant bounds need no variable lookup at all; reversed ones keep the helper's '1' fallback
+                return f"str(self._rng.randrange({int(args[0])}, {int(args[1]) + 1}))"
+            if function_name == 'random_subset_from_array' and args[1].isdigit():
+                # A constant subset size is passed as an int so it needs no parsing per request
+                return f"self._random_subset_from_array({args[0]!r}, {int(args[1])})"
+        else:
+            if not args:
+                return None
+            args = (args.strip(),)
+        return f"self._{function_name}({', '.join(map(repr, args))})"
+        
+    def _generate_template_code(self, template: str) -> str:
+        """Generate a concatenation of literal text and helper calls, templating only what needs it at runtime"""
+        parts = re.split(r'(\{\{[^{}]*\}\})', template)
+        # Each piece is (literal text, None) or (None, expression code)
+        pieces = []
+        for index, part in enumerate(parts):
+            call_code = self._generate_dynamic_call_code(part) if index % 2 else None
+            if call_code:
+                pieces.append((None, call_code))
+            elif '{' in part:
+                # Variable placeholders are only known per user, so the rest of the string is resolved at runtime
+                brace = part.index('{')
+                if brace:
+                    pieces.append((part[:brace], None))
+                pieces.append((None, f"self.replace_variables({part[brace:] + ''.join(parts[index + 1:])!r})"))
+                break
+            elif part:
+                pieces.append((part, None))
+        if len(pieces) > 2:
+            # Several segments are built in one step with an f-string instead of chained concatenation
+            fstring_code = self._generate_fstring_code(pieces)
+            if fstring_code:
+                return fstring_code
+        return ' + '.join(repr(text) if code is None else code for text, code in pieces) or "''"
+        
+    def _generate_fstring_code(self, pieces: List[Tuple[Optional[str], Optional[str]]]) -> Optional[str]:
+        """Join template pieces into a double-quoted f-string, or return None if one can't be embedded safely"""
+        fstring_parts = []
+        for text, code in pieces:
+            if code is None:
+                if any(char in text for char in '"\\\n\r'):
+                    return None
+                fstring_parts.append(text.replace('{', '{{').replace('}', '}}'))
+            else:
+                if any(char in code for char in '"\\{}'):
+                    return None
+                # Formatting converts to str already
+                if code.startswith('str(') and code.endswith(')'):
+                    code = code[4:-1]
+                fstring_parts.append('{' + code + '}')
+        return 'f"' + ''.join(fstring_parts) + '"'
+        
+    def _generate_value_code(self, value: Any) -> str:
+        """Generate the expression for a request value, resolving dynamic function calls at generation time"""
+        text = str(value)
+        if not self._is_template(text):
+            return repr(text)
+        return self._generate_template_code(text)
+        
+    def _generate_url_code(self, url: str) -> str:
+        """Generate the URL expression, only templating the parts that contain placeholders"""
+        return self._generate_value_code(url)
+        
     def generate_script(self):
         """Generate the complete Locust test script"""
         self.load_scenario()
@@ -565,132 +900,128 @@ class EnhancedScriptGenerator:
         base_url = self.scenario_data.get('base_url', 'http://localhost')
         min_wait = self.scenario_data.get('min_wait', 1000) / 1000.0
         max_wait = self.scenario_data.get('max_wait', 5000) / 1000.0
+        steps = self.scenario_data.get('steps', [])
+        self.regex_patterns = self._collect_regex_patterns(steps)
+        regex_patterns_code = ''.join(
+            f"{constant_name} = re.compile(r'{pattern}')\n" for pattern, constant_name in self.regex_patterns.items()
+        )
+        self.request_constants = self._collect_request_constants(steps)
+        request_constants_code = ''.join(
+            f"{constant_name} = {value_code}\n" for (_, value_code), constant_name in self.request_constants.items()
+        )
+        if request_constants_code:
+            request_constants_code = (
+                "\n# Request headers, params and bodies without placeholders, shared by every user\n"
+                + request_constants_code
+            )
         
-        script_content = f'''from locust import HttpUser, task, between
+        script_content = f'''from locust import HttpUser, task
+from locust.exception import InterruptTaskSet, RescheduleTask, RescheduleTaskImmediately, StopUser
 import json
 import time
 import logging
 import random
 import re
 
+try:
+    from orjson import dumps as orjson_dumps, loads as json_loads
+
+    def json_dumps(value):
+        return orjson_dumps(value).decode('utf-8')
+except ImportError:
+    from json import loads as json_loads
+
+    def json_dumps(value):
+        # Match orjson's compact output so variables look the same either way
+        return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+DYNAMIC_FUNCTION_RE = re.compile(
+    r'\\{{\\{{(random|random_from_array|random_subset_from_array|random_index_from_array)\\(([^)]*)\\)\\}}\\}}'
+)
+VARIABLE_PLACEHOLDER_RE = re.compile(r'\\{{([^{{}}]+)\\}}')
+{regex_patterns_code}{request_constants_code}
+# Compiled JSONPath expressions, shared by every user in this process
+JSON_PATH_CACHE = {{}}
+
+# Raised by Locust to stop or reschedule a user, so steps must let them through
+LOCUST_CONTROL_EXCEPTIONS = (InterruptTaskSet, RescheduleTask, RescheduleTaskImmediately, StopUser)
+
+logger = logging.getLogger(__name__)
+
 class {class_name}(HttpUser):
-    wait_time = between({min_wait}, {max_wait})
+    def wait_time(self):
+        \"\"\"Wait between {min_wait} and {max_wait} seconds, drawn from this user's generator\"\"\"
+        return self._rng.random() * {round(max_wait - min_wait, 6)} + {min_wait}
     
 {self._generate_data_source_code()}
 {self._generate_helper_methods()}
     
     def on_start(self):
+        # Extracted arrays are kept as lists and only JSON-encoded when substituted into text
         self.variables = {{}}
-        self.logger = logging.getLogger(__name__)
+        # String form of each array variable, as consumed by the random helpers
+        self.array_values = {{}}
+        # Each user draws from its own generator instead of the shared module-level one
+        self._rng = random.Random()
+        self._assertion_failures = []
         self.load_test_data()
+        # Test data rows are picked once per user, so index their fields as strings up front
+        self._test_data_values = {{}}
+        for source_name, data in self.test_data.items():
+            if source_name.endswith('_current') and isinstance(data, dict):
+                for field_name, value in data.items():
+                    self._test_data_values.setdefault(field_name, str(value))
     
     def replace_variables(self, text):
         \"\"\"Replace variables in text with actual values\"\"\"
-        if not text:
+        if not text or '{{' not in text:
             return text
         try:
-            # Handle dynamic functions first
-            text = self._replace_dynamic_functions(text)
+            # Handle dynamic functions first, skipping the call when there are none
+            if '{{{{' in text:
+                text = self._replace_dynamic_functions(text)
+                if '{{' not in text:
+                    return text
             
-            # Replace test data variables
-            for source_name, data in self.test_data.items():
-                if source_name.endswith('_current') and isinstance(data, dict):
-                    for field_name, value in data.items():
-                        placeholder = f'{{{{{{field_name}}}}}}'
-                        if placeholder in text:
-                            text = text.replace(placeholder, str(value))
-                            
-            # Replace extracted variables
-            for var_name, value in self.variables.items():
-                placeholder = f'{{{{{{var_name}}}}}}'
-                if placeholder in text:
-                    text = text.replace(placeholder, str(value))
-                    
-            return text
+            # Until something is extracted or loaded no placeholder can resolve
+            if not self.variables and not self._test_data_values:
+                return text
+            
+            # Replace test data and extracted variables in a single pass
+            return VARIABLE_PLACEHOLDER_RE.sub(self._resolve_placeholder, text)
         except Exception as e:
-            self.logger.error(f'Error replacing variables: {{str(e)}}')
+            logger.error('Error replacing variables: %s', e)
             return text
     
-    @task
-    def run_scenario(self):
-        \"\"\"Execute the complete test scenario\"\"\"
+    def _resolve_placeholder(self, match):
+        \"\"\"Resolve a {{name}} placeholder, preferring test data over extracted variables\"\"\"
+        name = match.group(1)
+        value = self._test_data_values.get(name)
+        if value is not None:
+            return value
+        value = self.variables.get(name)
+        if value is not None:
+            return json_dumps(value) if isinstance(value, list) else str(value)
+        return match.group(0)
 '''
         
-        # Generate code for each step
-        for step in self.scenario_data.get('steps', []):
-            step_id = step.get('id', 'unknown')
-            step_name = step.get('name', 'Unknown Step')
-            method = step.get('method', 'GET')
-            url = step.get('url', '/')
-            headers = step.get('headers', {})
-            params = step.get('params', {})
-            body = step.get('body')
-            extract = step.get('extract', {})
-            assertions = step.get('assertions', [])
-            
-            script_content += f'''
-        # Step: {step_name}
-        try:
-            url = self.replace_variables('{url}')
-            headers = {{}}
-'''
-            
-            # Add headers
-            for header_name, header_value in headers.items():
-                script_content += f"            headers['{header_name}'] = self.replace_variables('{header_value}')\n"
-            
-            script_content += f"""
-            headers['Accept'] = 'application/json'
-            
-            # Prepare request parameters
-"""
-            
-            # Add query parameters
-            if params:
-                script_content += "            params = {}\n"
-                for param_name, param_value in params.items():
-                    script_content += f"            params['{param_name}'] = self.replace_variables('{param_value}')\n"
-            else:
-                script_content += "            params = {}\n"
-            
-            # Add request body
-            if body:
-                script_content += f"            body = {json.dumps(body, indent=12)}\n"
-                script_content += "            body = self.replace_variables(json.dumps(body))\n"
-                script_content += "            body = json.loads(body)\n"
-            else:
-                script_content += "            body = None\n"
-            
-            # Make the request
-            script_content += f"""
-            with self.client.{method.lower()}(
-                url,
-                headers=headers,
-                params=params,
-                json=body,
-                catch_response=True) as response:
-"""
-            
-            # Add extraction code with proper indentation
-            extraction_code = self._generate_extraction_code(extract)
-            # Indent the extraction code properly
-            extraction_code = '\n'.join('                ' + line if line.strip() else line 
-                                      for line in extraction_code.split('\n'))
-            script_content += extraction_code
-            
-            # Add assertion code with proper indentation
-            assertion_code = self._generate_assertion_code(assertions)
-            # Indent the assertion code properly
-            assertion_code = '\n'.join('                ' + line if line.strip() else line 
-                                     for line in assertion_code.split('\n'))
-            script_content += assertion_code
-            
-            script_content += """
-        except Exception as e:
-            self.logger.error(f'Error in API call: {str(e)}')
-"""
+        # Generate one method per step so run_scenario stays a short sequence of calls
+        script_parts = [script_content]
+        step_method_names = []
+        for step in steps:
+            step_method_name = self._generate_step_method_name(step.get('id', 'unknown'), step_method_names)
+            step_method_names.append(step_method_name)
+            script_parts.append(self._generate_step_code(step, step_method_name))
         
-        script_content += "\n"
+        script_parts.append("""    @task
+    def run_scenario(self):
+        \"\"\"Execute the complete test scenario\"\"\"
+""")
+        script_parts.extend(f"        self.{name}()\n" for name in step_method_names)
+        if not step_method_names:
+            script_parts.append("        pass\n")
+        script_parts.append("\n")
+        script_content = ''.join(script_parts)
         
         # Write the script to file
         try:
@@ -701,6 +1032,123 @@ class {class_name}(HttpUser):
             self.logger.error(f"Error writing script file: {str(e)}")
             raise
             
+    def _generate_step_code(self, step: Dict, step_method_name: str) -> str:
+        """Generate the method that runs a single scenario step"""
+        step_name = step.get('name', 'Unknown Step')
+        method = step.get('method', 'GET')
+        url = step.get('url', '/')
+        params = step.get('params', {})
+        body = step.get('body')
+        extract = step.get('extract', {})
+        assertions = step.get('assertions', [])
+        
+        # Extraction and assertion logging is skipped entirely unless INFO is enabled
+        info_enabled_code = (
+            "        info_enabled = logger.isEnabledFor(logging.INFO)\n" if extract or assertions else ""
+        )
+        parts = [f'''
+    def {step_method_name}(self):
+        \"\"\"Step: {step_name}\"\"\"
+{info_enabled_code}        try:
+            url = {self._generate_url_code(url)}
+''']
+        
+        # Add headers
+        step_headers = self._step_headers(step)
+        headers_constant = self.request_constants.get(('STATIC_HEADERS', repr(step_headers)))
+        if headers_constant:
+            parts.append(f"            headers = {headers_constant}\n")
+        else:
+            # Only header values with placeholders are resolved per request
+            header_items = ', '.join(
+                f"{header_name!r}: {self._generate_value_code(header_value)}"
+                for header_name, header_value in step_headers.items()
+            )
+            parts.append(f"            headers = {{{header_items}}}\n")
+        
+        # Empty params and bodies are left out of the call entirely
+        request_kwargs = ['headers=headers']
+        if params or body:
+            parts.append("""
+            # Prepare request parameters
+""")
+        
+        # Add query parameters
+        params_constant = self.request_constants.get(('STATIC_PARAMS', repr(params)))
+        if params_constant:
+            parts.append(f"            params = {params_constant}\n")
+        elif params:
+            param_items = ', '.join(
+                f"{param_name!r}: {self._generate_value_code(param_value)}" for param_name, param_value in params.items()
+            )
+            parts.append(f"            params = {{{param_items}}}\n")
+        if params:
+            request_kwargs.append('params=params')
+        
+        # Add request body
+        body_constant = self.request_constants.get(('STATIC_BODY', repr(body)))
+        if body_constant:
+            parts.append(f"            body = {body_constant}\n")
+        elif body:
+            parts.append(f"            body = {body!r}\n")
+            parts.append("            body = self.replace_variables(json_dumps(body))\n")
+            parts.append("            body = json_loads(body)\n")
+        if body:
+            request_kwargs.append('json=body')
+        
+        # Make the request
+        request_kwargs_code = ''.join(f"                {kwarg},\n" for kwarg in request_kwargs)
+        parts.append(f"""
+            with self.client.{method.lower()}(
+                url,
+{request_kwargs_code}                catch_response=True) as response:
+""")
+        
+        # Add response parsing code with proper indentation
+        shared_paths = self._shared_json_paths(extract, assertions)
+        parsing_code = self._generate_response_parsing_code(extract, assertions, shared_paths)
+        body_parsing_code = ""
+        if self._status_guards_json_paths(extract, assertions):
+            # Only assertions read the body, so a response with the wrong status is never parsed
+            body_parsing_code, parsing_code = parsing_code, ""
+        parsing_code = '\n'.join('                ' + line if line.strip() else line 
+                                for line in parsing_code.split('\n'))
+        parts.append(parsing_code)
+        
+        # Add extraction code with proper indentation
+        extraction_code = self._generate_extraction_code(extract, shared_paths)
+        # Indent the extraction code properly
+        extraction_code = '\n'.join('                ' + line if line.strip() else line 
+                                  for line in extraction_code.split('\n'))
+        parts.append(extraction_code)
+        
+        # Add assertion code with proper indentation
+        assertion_code = self._generate_assertion_code(assertions, shared_paths, body_parsing_code)
+        # Indent the assertion code properly
+        assertion_code = '\n'.join('                ' + line if line.strip() else line 
+                                 for line in assertion_code.split('\n'))
+        parts.append(assertion_code)
+        if not (parsing_code.strip() or extraction_code.strip() or assertion_code.strip()):
+            # Nothing to check, the with block only reports the request
+            parts.append("                pass\n")
+        
+        parts.append(f"""
+        except LOCUST_CONTROL_EXCEPTIONS:
+            raise
+        except Exception:
+            # A failing step is logged with its traceback and the scenario moves on to the next step
+            logger.exception('Error in API call for step %s', {step_name!r})
+    
+""")
+        return ''.join(parts)
+        
+    def _generate_step_method_name(self, step_id: str, existing_names: List[str]) -> str:
+        """Generate a unique method name for a step from its id"""
+        method_name = '_step_' + re.sub(r'\W', '_', str(step_id)).lower()
+        if method_name in existing_names:
+            method_name = f'{method_name}_{len(existing_names) + 1}'
+        return method_name
+        
     def _generate_class_name(self, scenario_name: str) -> str:
         """Generate a valid Python class name from scenario name"""
         # Remove special characters and convert to CamelCase
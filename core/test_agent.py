@@ -334,18 +334,25 @@ class LocustTestAgent:
             "import time",
             "import logging",
             "",
+            "try:",
+            "    from orjson import loads as json_loads",
+            "except ImportError:",
+            "    from json import loads as json_loads",
+            "",
             f"class {self._class_name_from_scenario(scenario['name'])}User(HttpUser):",
             f"    wait_time = between({min_wait_sec}, {max_wait_sec})",
             "",
             "    def on_start(self):",
             "        self.variables = {}",
+            "        # Placeholder text for each variable, built once when the variable is stored",
+            "        self.placeholder_values = {}",
             "        self.logger = logging.getLogger(__name__)",
             "",
             "    def extract_variables(self, response, extract_config):",
             "        if not extract_config:",
             "            return",
             "        try:",
-            "            data = response.json()",
+            "            data = json_loads(response.content)",
             "            for var_name, json_path in extract_config.items():",
             "                try:",
             "                    parts = json_path.split('.')",
@@ -358,21 +365,22 @@ class LocustTestAgent:
             "                            break",
             "                    if value is not None:",
             "                        self.variables[var_name] = str(value)",
-            "                        self.logger.info(f'Extracted {var_name} = {value}')",
+            "                        self.placeholder_values['{{' + var_name + '}}'] = self.variables[var_name]",
+            "                        self.logger.info('Extracted %s = %s', var_name, value)",
             "                except Exception as e:",
-            "                    self.logger.error(f'Error extracting {var_name}: {str(e)}')",
+            "                    self.logger.error('Error extracting %s: %s', var_name, e)",
             "        except Exception as e:",
-            "            self.logger.error(f'Error parsing response JSON: {str(e)}')",
+            "            self.logger.error('Error parsing response JSON: %s', e)",
             "",
             "    def replace_variables(self, text):",
-            "        if not text:",
+            "        if not text or '{{' not in text:",
             "            return text",
             "        try:",
-            "            for var_name, value in self.variables.items():",
-            "                text = text.replace(f'{{{{{var_name}}}}}', str(value))",
+            "            for placeholder, value in self.placeholder_values.items():",
+            "                text = text.replace(placeholder, value)",
             "            return text",
             "        except Exception as e:",
-            "            self.logger.error(f'Error replacing variables: {str(e)}')",
+            "            self.logger.error('Error replacing variables: %s', e)",
             "            return text",
             "",
             "    @task",
@@ -453,7 +461,7 @@ class LocustTestAgent:
                 
                 script_lines.extend(block_lines)
                 script_lines.append("        except Exception as e:")
-                script_lines.append("            self.logger.error(f'Error in API call: {str(e)}')")
+                script_lines.append("            self.logger.error('Error in API call: %s', e)")
                 script_lines.append("")
             
             elif step.get("type") == "wait":
@@ -22,6 +22,7 @@ python -m Locust_AI_Agent run-test \
     --scenario-config sample_scenario_config.json \
     --test-config sample_test_config.json \
     --output-file test_results.json \
+    --pretty \
     --verbose
 
 echo ""
@@ -38,6 +39,7 @@ if [ ! -z "$OPENAI_API_KEY" ]; then
         --scenario-config sample_scenario_config.json \
         --test-config sample_test_config.json \
         --output-file test_results_with_llm.json \
+        --pretty \
         --use-llm \
         --llm-api-key "$OPENAI_API_KEY" \
         --verbose
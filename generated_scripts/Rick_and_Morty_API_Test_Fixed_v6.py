@@ -1,126 +1,153 @@
-from locust import HttpUser, task, between
+from locust import HttpUser, task
+from locust.exception import InterruptTaskSet, RescheduleTask, RescheduleTaskImmediately, StopUser
 import json
 import time
 import logging
 import random
 import re
 
+try:
+    from orjson import dumps as orjson_dumps, loads as json_loads
+
+    def json_dumps(value):
+        return orjson_dumps(value).decode('utf-8')
+except ImportError:
+    from json import loads as json_loads
+
+    def json_dumps(value):
+        # Match orjson's compact output so variables look the same either way
+        return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+DYNAMIC_FUNCTION_RE = re.compile(
+    r'\{\{(random|random_from_array|random_subset_from_array|random_index_from_array)\(([^)]*)\)\}\}'
+)
+VARIABLE_PLACEHOLDER_RE = re.compile(r'\{([^{}]+)\}')
+
+# Request headers, params and bodies without placeholders, shared by every user
+STATIC_HEADERS_1 = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+
+# Compiled JSONPath expressions, shared by every user in this process
+JSON_PATH_CACHE = {}
+
+# Raised by Locust to stop or reschedule a user, so steps must let them through
+LOCUST_CONTROL_EXCEPTIONS = (InterruptTaskSet, RescheduleTask, RescheduleTaskImmediately, StopUser)
+
+logger = logging.getLogger(__name__)
+
 class RickAndMortyApiTestUser(HttpUser):
-    wait_time = between(1.0, 3.0)
+    def wait_time(self):
+        """Wait between 1.0 and 3.0 seconds, drawn from this user's generator"""
+        return self._rng.random() * 2.0 + 1.0
     
 
+    # Test data is stored column-wise and built once at import: each field maps to a
+    # tuple of values and every row shares the same index across those tuples
+    _TEST_DATA_COLUMNS = {}
+    
     def load_test_data(self):
-        """Load test data from various sources"""
+        """Pick this user's row from each test data source"""
         self.test_data = {}
-
-        # No data sources defined - using empty test data
-        pass
-
-
+        for source_name, columns in self._TEST_DATA_COLUMNS.items():
+            row_count = len(next(iter(columns.values()), ()))
+            if row_count:
+                index = self._rng.randrange(row_count)
+                self.test_data[f'{source_name}_current'] = {
+                    field_name: values[index] for field_name, values in columns.items()
+                    if values[index] is not None
+                }
+
+
+    def _compile_json_path(self, expression):
+        """Compile a JSONPath-like expression into a tuple of (operation, argument) steps"""
+        # Skip the '$.' prefix, give every [*] its own part and treat [0] like .0
+        path = re.sub(r'\[(\d+)\]', r'.\1', expression[2:])
+        parts = [part for part in path.replace('[*]', '.[*].').split('.') if part]
+        
+        operations = []
+        i = 0
+        while i < len(parts):
+            part = parts[i]
+            if part == '[*]':
+                if i + 1 == len(parts):
+                    # A trailing wildcard returns the array itself
+                    operations.append(('all', None))
+                else:
+                    # Otherwise the next property is extracted from each item
+                    operations.append(('map', parts[i + 1]))
+                    i += 1
+            elif part.isdigit():
+                operations.append(('index', (part, int(part))))
+            else:
+                operations.append(('key', part))
+            i += 1
+        return tuple(operations)
+    
     def _extract_json_path(self, data, expression):
         """Extract value using JSONPath-like expression"""
         try:
             if not expression.startswith('$'):
                 return None
-                
-            # Split the path more intelligently to handle [*] syntax
-            parts = []
-            current_part = ""
-            i = 2  # Skip the '$.' prefix
-            while i < len(expression):
-                char = expression[i]
-                if char == '.':
-                    if current_part:
-                        parts.append(current_part)
-                        current_part = ""
-                elif char == '[' and i + 2 < len(expression) and expression[i:i+3] == '[*]':
-                    if current_part:
-                        parts.append(current_part)
-                    parts.append('[*]')
-                    current_part = ""
-                    i += 2  # Skip the '[*]'
-                else:
-                    current_part += char
-                i += 1
-            if current_part:
-                parts.append(current_part)
+            # Each expression is compiled once and reused by every user
+            operations = JSON_PATH_CACHE.get(expression)
+            if operations is None:
+                operations = JSON_PATH_CACHE.setdefault(expression, self._compile_json_path(expression))
+            # Parsed JSON only holds plain dicts and lists, so exact type checks are enough
+            dict_type = dict
+            list_type = list
             current = data
-            i = 0
-            print(f'DEBUG: JSONPath extraction: {expression}')
-            print(f'DEBUG: Parsed parts: {parts}')
-            print(f'DEBUG: Input data type: {type(data)}')
-            if isinstance(data, dict):
-                print(f'DEBUG: Available keys: {list(data.keys())}')
-            elif isinstance(data, list):
-                print(f'DEBUG: Array length: {len(data)}')
-            while i < len(parts):
-                part = parts[i]
-                print(f'DEBUG: Processing part {i+1}: {part}, current type: {type(current)}')
-                if isinstance(current, dict):
-                    if part in current:
-                        current = current[part]
-                        print(f'DEBUG: Found key {part}, new current type: {type(current)}')
-                    else:
-                        print(f'DEBUG: Key {part} not found in dict. Available keys: {list(current.keys())}')
+            for operation, argument in operations:
+                current_type = type(current)
+                if operation == 'key':
+                    if current_type is not dict_type:
+                        logger.debug('JSONPath %s: cannot read key %s from %s', expression, argument, current_type)
+                        return None
+                    try:
+                        current = current[argument]
+                    except KeyError:
+                        logger.debug('JSONPath %s: key %s not found', expression, argument)
                         return None
-                elif isinstance(current, list):
-                    if part == '[*]':
-                        # If this is the last part, just return the array
-                        if i + 1 == len(parts):
-                            print(f'DEBUG: Wildcard found, returning array with {len(current)} items')
-                            return current
-                        # Otherwise, extract the next property from each item and continue
-                        next_part = parts[i + 1]
-                        print(f'DEBUG: Extracting property {next_part} from each array item')
-                        current = [item.get(next_part) for item in current if isinstance(item, dict) and next_part in item]
-                        print(f'DEBUG: Extracted {next_part} from {len(current)} items')
-                        i += 1  # Skip the next part, since we've just processed it
-                    elif part.isdigit():
-                        index = int(part)
-                        if 0 <= index < len(current):
-                            current = current[index]
-                            print(f'DEBUG: Accessed index {index}, new current type: {type(current)}')
-                        else:
-                            print(f'DEBUG: Index {index} out of range for array of length {len(current)}')
+                elif operation == 'map':
+                    if current_type is not list_type:
+                        logger.debug('JSONPath %s: cannot apply wildcard to %s', expression, current_type)
+                        return None
+                    current = [item[argument] for item in current if type(item) is dict_type and argument in item]
+                elif operation == 'index':
+                    key, index = argument
+                    if current_type is dict_type:
+                        try:
+                            current = current[key]
+                        except KeyError:
+                            logger.debug('JSONPath %s: key %s not found', expression, key)
                             return None
+                    elif current_type is list_type and 0 <= index < len(current):
+                        current = current[index]
                     else:
-                        print(f'DEBUG: Invalid part {part} for array type')
+                        logger.debug('JSONPath %s: index %d not available on %s', expression, index, current_type)
                         return None
                 else:
-                    print(f'DEBUG: Cannot process part {part} on type {type(current)}')
-                    return None
-                i += 1
-            print(f'DEBUG: Final result: {current}')
+                    # A trailing wildcard only applies to arrays
+                    return current if current_type is list_type else None
             return current
         except Exception as e:
-            print(f'DEBUG: Error extracting JSONPath {expression}: {str(e)}')
-            self.logger.error(f'Error extracting JSONPath {expression}: {{str(e)}}')
-            return None
-            
-    def _extract_regex(self, text, pattern):
-        """Extract value using regex pattern"""
-        try:
-            match = re.search(pattern, text)
-            return match.group(1) if match and match.groups() else match.group(0) if match else None
-        except Exception as e:
-            self.logger.error(f'Error extracting regex {pattern}: {{str(e)}}')
+            logger.error('Error extracting JSONPath %s: %s', expression, e)
             return None
             
-    def _extract_boundary(self, text, left_boundary, right_boundary):
-        """Extract value between left and right boundaries"""
+    def _extract_boundary(self, content, left_boundary, right_boundary):
+        """Extract value between left and right boundaries in the raw response body"""
         try:
-            start = text.find(left_boundary)
+            start = content.find(left_boundary)
             if start == -1:
                 return None
             start += len(left_boundary)
             
-            end = text.find(right_boundary, start)
+            end = content.find(right_boundary, start)
             if end == -1:
                 return None
                 
-            return text[start:end].strip()
+            # Only the matched slice is decoded, never the whole body
+            return str(memoryview(content)[start:end], 'utf-8', 'replace').strip()
         except Exception as e:
-            self.logger.error(f'Error extracting boundary: {{str(e)}}')
+            logger.error('Error extracting boundary: %s', e)
             return None
             
     def _get_test_data_value(self, source_name, field_name):
@@ -131,99 +158,119 @@ class RickAndMortyApiTestUser(HttpUser):
                 return current_data.get(field_name)
             return None
         except Exception as e:
-            self.logger.error(f'Error getting test data value: {{str(e)}}')
+            logger.error('Error getting test data value: %s', e)
             return None
             
     def _replace_dynamic_functions(self, text):
         """Replace dynamic function calls in text"""
-        try:
-            # Handle random(min, max) function
-            random_pattern = r'\{\{random\(([^,]+),\s*([^)]+)\)\}\}'
-            def replace_random(match):
-                min_val = match.group(1).strip()
-                max_val = match.group(2).strip()
-                # Try to resolve variables in min/max values
-                min_val = self._resolve_single_value(min_val)
-                max_val = self._resolve_single_value(max_val)
-                try:
-                    min_int = int(min_val)
-                    max_int = int(max_val)
-                    return str(random.randint(min_int, max_int))
-                except (ValueError, TypeError):
-                    return '1'  # fallback
-            text = re.sub(random_pattern, replace_random, text)
-            
-            # Handle random_from_array(array_var) function
-            random_array_pattern = r'\{\{random_from_array\(([^)]+)\)\}\}'
-            def replace_random_array(match):
-                array_var = match.group(1).strip()
-                if array_var in self.variables:
-                    try:
-                        # Try to parse as JSON array first
-                        array_data = json.loads(self.variables[array_var])
-                        if isinstance(array_data, list) and array_data:
-                            return str(random.choice(array_data))
-                    except (json.JSONDecodeError, TypeError):
-                        # If not JSON, try to split by comma (fallback)
-                        try:
-                            array_str = self.variables[array_var]
-                            if ',' in array_str:
-                                array_data = [item.strip() for item in array_str.split(',')]
-                                if array_data:
-                                    return str(random.choice(array_data))
-                        except:
-                            pass
-                return '1'  # fallback
-            text = re.sub(random_array_pattern, replace_random_array, text)
-            
-            # Handle random_subset_from_array(array_var, n) function
-            random_subset_pattern = r'\{\{random_subset_from_array\(([^,]+),\s*([^)]+)\)\}\}'
-            def replace_random_subset(match):
-                array_var = match.group(1).strip()
-                n_val = match.group(2).strip()
-                n_val = self._resolve_single_value(n_val)
-                try:
-                    n = int(n_val)
-                except (ValueError, TypeError):
-                    n = 1
-                
-                if array_var in self.variables:
-                    try:
-                        array_data = json.loads(self.variables[array_var])
-                        if isinstance(array_data, list) and array_data:
-                            subset = random.sample(array_data, min(n, len(array_data)))
-                            # Return comma-separated values for URL usage instead of JSON array
-                            return ','.join(map(str, subset))
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-                return ''  # fallback
-            text = re.sub(random_subset_pattern, replace_random_subset, text)
-            
-            # Handle random_index_from_array(array_var) function
-            random_index_pattern = r'\{\{random_index_from_array\(([^)]+)\)\}\}'
-            def replace_random_index(match):
-                array_var = match.group(1).strip()
-                if array_var in self.variables:
-                    try:
-                        array_data = json.loads(self.variables[array_var])
-                        if isinstance(array_data, list) and array_data:
-                            return str(random.randint(0, len(array_data) - 1))
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-                return '0'  # fallback
-            text = re.sub(random_index_pattern, replace_random_index, text)
-            
+        if not text or '{{' not in text:
             return text
+        try:
+            # All dynamic functions are matched in a single pass and dispatched by name
+            return DYNAMIC_FUNCTION_RE.sub(self._call_dynamic_function, text)
         except Exception as e:
-            self.logger.error(f'Error replacing dynamic functions: {{str(e)}}')
+            logger.error('Error replacing dynamic functions: %s', e)
             return text
     
-    def _resolve_single_value(self, value):
-        """Resolve a single value, handling variable references"""
-        if value in self.variables:
-            return self.variables[value]
-        return value
+    def _call_dynamic_function(self, match):
+        """Evaluate one dynamic function call, leaving malformed calls untouched"""
+        function_name, args = match.group(1), match.group(2)
+        if function_name in ('random', 'random_subset_from_array'):
+            first, separator, second = args.partition(',')
+            if not separator or not first or not second:
+                return match.group(0)
+            args = (first.strip(), second.strip())
+        else:
+            if not args:
+                return match.group(0)
+            args = (args.strip(),)
+        return self._DYNAMIC_FUNCTIONS[function_name](self, *args)
+    
+    def _random(self, min_val, max_val):
+        """Handle random(min, max) function"""
+        # Either bound may name an extracted variable
+        variables = self.variables
+        min_val = variables.get(min_val, min_val)
+        max_val = variables.get(max_val, max_val)
+        try:
+            min_int = int(min_val)
+            max_int = int(max_val)
+            return str(self._rng.randrange(min_int, max_int + 1))
+        except (ValueError, TypeError):
+            return '1'  # fallback
+    
+    def _random_from_array(self, array_var):
+        """Handle random_from_array(array_var) function"""
+        if array_var in self.variables:
+            try:
+                # Try to parse as JSON array first
+                array_data = self._get_array_variable(array_var)
+                if array_data:
+                    return self._rng.choice(array_data)
+            except (json.JSONDecodeError, TypeError):
+                # If not JSON, try to split by comma (fallback)
+                try:
+                    array_str = self.variables[array_var]
+                    if ',' in array_str:
+                        array_data = [item.strip() for item in array_str.split(',')]
+                        if array_data:
+                            return str(self._rng.choice(array_data))
+                except:
+                    pass
+        return '1'  # fallback
+    
+    def _random_subset_from_array(self, array_var, n_val):
+        """Handle random_subset_from_array(array_var, n) function"""
+        if type(n_val) is int:
+            n = n_val
+        else:
+            n_val = self.variables.get(n_val, n_val)
+            try:
+                n = int(n_val)
+            except (ValueError, TypeError):
+                n = 1
         
+        if array_var in self.variables:
+            try:
+                array_data = self._get_array_variable(array_var)
+                if array_data:
+                    subset = self._rng.sample(array_data, min(n, len(array_data)))
+                    # Return comma-separated values for URL usage instead of JSON array
+                    return ','.join(subset)
+            except (json.JSONDecodeError, TypeError):
+                pass
+        return ''  # fallback
+    
+    def _random_index_from_array(self, array_var):
+        """Handle random_index_from_array(array_var) function"""
+        if array_var in self.variables:
+            try:
+                array_data = self._get_array_variable(array_var)
+                if array_data:
+                    return str(self._rng.randrange(len(array_data)))
+            except (json.JSONDecodeError, TypeError):
+                pass
+        return '0'  # fallback
+    
+    def _get_array_variable(self, array_var):
+        """Return an array variable as a tuple of strings, converting it once per extraction"""
+        array_values = self.array_values.get(array_var)
+        if array_values is None:
+            array_data = self.variables[array_var]
+            if not isinstance(array_data, list):
+                array_data = json_loads(array_data)
+            # Values that aren't JSON arrays convert to an empty tuple so callers use their fallback
+            array_values = tuple(map(str, array_data)) if isinstance(array_data, list) else ()
+            self.array_values[array_var] = array_values
+        return array_values
+    
+    _DYNAMIC_FUNCTIONS = {
+        'random': _random,
+        'random_from_array': _random_from_array,
+        'random_subset_from_array': _random_subset_from_array,
+        'random_index_from_array': _random_index_from_array,
+    }
+    
     def _apply_transform(self, value, transform_name):
         """Apply custom transformation to extracted value"""
         try:
@@ -232,460 +279,572 @@ class RickAndMortyApiTestUser(HttpUser):
             # Add more transformations as needed
             return value
         except Exception as e:
-            self.logger.error(f'Error applying transform {transform_name}: {{str(e)}}')
+            logger.error('Error applying transform %s: %s', transform_name, e)
             return value
             
     def _extract_page_number(self, url):
         """Extract page number from next URL"""
-        if url and 'page=' in url:
-            match = re.search(r'page=(\d+)', url)
-            if match:
-                return int(match.group(1))
+        if not url:
+            return 1
+        # Scan for the digits after 'page=' directly instead of running a regex
+        start = url.find('page=')
+        while start != -1:
+            start += 5
+            end = start
+            while end < len(url) and url[end] in '0123456789':
+                end += 1
+            if end > start:
+                return int(url[start:end])
+            start = url.find('page=', start)
         return 1
 
     
     def on_start(self):
+        # Extracted arrays are kept as lists and only JSON-encoded when substituted into text
         self.variables = {}
-        self.logger = logging.getLogger(__name__)
+        # String form of each array variable, as consumed by the random helpers
+        self.array_values = {}
+        # Each user draws from its own generator instead of the shared module-level one
+        self._rng = random.Random()
+        self._assertion_failures = []
         self.load_test_data()
+        # Test data rows are picked once per user, so index their fields as strings up front
+        self._test_data_values = {}
+        for source_name, data in self.test_data.items():
+            if source_name.endswith('_current') and isinstance(data, dict):
+                for field_name, value in data.items():
+                    self._test_data_values.setdefault(field_name, str(value))
     
     def replace_variables(self, text):
         """Replace variables in text with actual values"""
-        if not text:
+        if not text or '{' not in text:
             return text
         try:
-            # Handle dynamic functions first
-            text = self._replace_dynamic_functions(text)
+            # Handle dynamic functions first, skipping the call when there are none
+            if '{{' in text:
+                text = self._replace_dynamic_functions(text)
+                if '{' not in text:
+                    return text
             
-            # Replace test data variables
-            for source_name, data in self.test_data.items():
-                if source_name.endswith('_current') and isinstance(data, dict):
-                    for field_name, value in data.items():
-                        placeholder = f'{{{field_name}}}'
-                        if placeholder in text:
-                            text = text.replace(placeholder, str(value))
-                            
-            # Replace extracted variables
-            for var_name, value in self.variables.items():
-                placeholder = f'{{{var_name}}}'
-                if placeholder in text:
-                    text = text.replace(placeholder, str(value))
-                    
-            return text
+            # Until something is extracted or loaded no placeholder can resolve
+            if not self.variables and not self._test_data_values:
+                return text
+            
+            # Replace test data and extracted variables in a single pass
+            return VARIABLE_PLACEHOLDER_RE.sub(self._resolve_placeholder, text)
         except Exception as e:
-            self.logger.error(f'Error replacing variables: {str(e)}')
+            logger.error('Error replacing variables: %s', e)
             return text
     
-    @task
-    def run_scenario(self):
-        """Execute the complete test scenario"""
-
-        # Step: Get Characters List - Extract Total Pages
+    def _resolve_placeholder(self, match):
+        """Resolve a {name} placeholder, preferring test data over extracted variables"""
+        name = match.group(1)
+        value = self._test_data_values.get(name)
+        if value is not None:
+            return value
+        value = self.variables.get(name)
+        if value is not None:
+            return json_dumps(value) if isinstance(value, list) else str(value)
+        return match.group(0)
+
+    def _step_get_characters_list(self):
+        """Step: Get Characters List - Extract Total Pages"""
+        info_enabled = logger.isEnabledFor(logging.INFO)
         try:
-            url = self.replace_variables('/api/character')
-            headers = {}
-            headers['Content-Type'] = self.replace_variables('application/json')
-
-            headers['Accept'] = 'application/json'
-            
-            # Prepare request parameters
-            params = {}
-            body = None
+            url = '/api/character'
+            headers = STATIC_HEADERS_1
 
             with self.client.get(
                 url,
                 headers=headers,
-                params=params,
-                json=body,
                 catch_response=True) as response:
 
-                        # Extract variables from response
+                        # Parse the response body once for extraction and assertions
                         try:
-                            response_data = response.json()
+                            response_data = json_loads(response.content)
+                        except (ValueError, TypeError):
+                            response_data = None
+
+                        # Evaluate JSONPaths used by both extraction and assertions once
+                        json_path_value_1 = response_data.get('info') if isinstance(response_data, dict) else None
+                        json_path_value_1 = json_path_value_1.get('pages') if isinstance(json_path_value_1, dict) else None
+                        json_path_value_2 = response_data.get('info') if isinstance(response_data, dict) else None
+                        json_path_value_2 = json_path_value_2.get('count') if isinstance(json_path_value_2, dict) else None
+
+                        # Extract variables from response, binding this user's stores once for the whole step
+                        try:
+                            variables = self.variables
+                            array_values = self.array_values
 
                             # Extract total_pages using JSONPath: $.info.pages
-                            total_pages_value = self._extract_json_path(response_data, '$.info.pages')
+                            total_pages_value = json_path_value_1
                             if total_pages_value is not None:
 
-                                # Store as JSON if it's an array, otherwise as string
+                                # Keep arrays as lists for the random helpers, store everything else as a string
                                 if isinstance(total_pages_value, list):
-                                    self.variables['total_pages'] = json.dumps(total_pages_value)
-                                    self.logger.info(f'Extracted array total_pages with {len(total_pages_value)} items')
+                                    variables['total_pages'] = total_pages_value
+                                    array_values['total_pages'] = tuple(map(str, total_pages_value))
+                                    if info_enabled:
+                                        logger.info('Extracted array total_pages with %d items', len(total_pages_value))
                                 else:
-                                    self.variables['total_pages'] = str(total_pages_value)
-                                    self.logger.info(f'Extracted total_pages = {self.variables["total_pages"]}')
+                                    variables['total_pages'] = str(total_pages_value)
+                                    array_values.pop('total_pages', None)
+                                    if info_enabled:
+                                        logger.info('Extracted total_pages = %s', variables['total_pages'])
                             else:
-                                self.logger.warning(f'Failed to extract total_pages using JSONPath: $.info.pages')
+                                logger.warning('Failed to extract total_pages using JSONPath: $.info.pages')
 
                             # Extract total_count using JSONPath: $.info.count
-                            total_count_value = self._extract_json_path(response_data, '$.info.count')
+                            total_count_value = json_path_value_2
                             if total_count_value is not None:
 
-                                # Store as JSON if it's an array, otherwise as string
+                                # Keep arrays as lists for the random helpers, store everything else as a string
                                 if isinstance(total_count_value, list):
-                                    self.variables['total_count'] = json.dumps(total_count_value)
-                                    self.logger.info(f'Extracted array total_count with {len(total_count_value)} items')
+                                    variables['total_count'] = total_count_value
+                                    array_values['total_count'] = tuple(map(str, total_count_value))
+                                    if info_enabled:
+                                        logger.info('Extracted array total_count with %d items', len(total_count_value))
                                 else:
-                                    self.variables['total_count'] = str(total_count_value)
-                                    self.logger.info(f'Extracted total_count = {self.variables["total_count"]}')
+                                    variables['total_count'] = str(total_count_value)
+                                    array_values.pop('total_count', None)
+                                    if info_enabled:
+                                        logger.info('Extracted total_count = %s', variables['total_count'])
                             else:
-                                self.logger.warning(f'Failed to extract total_count using JSONPath: $.info.count')
+                                logger.warning('Failed to extract total_count using JSONPath: $.info.count')
 
                         except Exception as e:
-                            self.logger.error(f'Error extracting variables: {{str(e)}}')
+                            logger.error('Error extracting variables: %s', e)
 
-                        # Run assertions
-                        assertion_failures = []
+                        # Run assertions, reusing this user's failure list instead of allocating one per step;
+                        # failures are (template, args) pairs that are only formatted when reported
+                        assertion_failures = self._assertion_failures
+                        assertion_failures.clear()
+                        status_code = response.status_code
+                        elapsed_ms = response.elapsed.total_seconds() * 1000
 
                         # Status code assertion
-                        if response.status_code != 200:
-                            assertion_failures.append(f'Characters API should return 200 status: expected 200, got {response.status_code}')
+                        if status_code != 200:
+                            assertion_failures.append(('Characters API should return 200 status: expected 200, got %s', (status_code,)))
 
-                        # JSONPath assertion: $.info.pages
-                        try:
-                            json_value = self._extract_json_path(response.json(), '$.info.pages')
-                            if json_value is not None:
+                        # Response time assertion
+                        if elapsed_ms > 5000:
+                            assertion_failures.append(('Response should complete within 5 seconds: response time %.0fms exceeds 5000ms', (elapsed_ms,)))
+
+                        # Body assertions
+                        if status_code == 200:
+                            # JSONPath assertion: $.info.pages
+                            try:
+                                json_value = json_path_value_1
+                                if json_value is not None:
+
+                                    # Handle min/max comparison - check length if it's a list, otherwise compare directly
+                                    if isinstance(json_value, list):
+                                        if len(json_value) < 1:
+                                            assertion_failures.append(('Should have at least 1 page: list has %d items, which is below minimum 1', (len(json_value),)))
+                                    else:
+                                        if json_value < 1:
+                                            assertion_failures.append(('Should have at least 1 page: value %s is below minimum 1', (json_value,)))
 
-                                # Handle min comparison - check length if it's a list, otherwise compare directly
-                                if isinstance(json_value, list):
-                                    if len(json_value) < 1:
-                                        assertion_failures.append(f'Should have at least 1 page: list has {len(json_value)} items, which is below minimum 1')
                                 else:
-                                    if json_value < 1:
-                                        assertion_failures.append(f'Should have at least 1 page: value {json_value} is below minimum 1')
-
-                            else:
-                                assertion_failures.append(f'Should have at least 1 page: JSONPath expression returned None')
-                        except Exception as e:
-                            assertion_failures.append(f'Should have at least 1 page: error evaluating JSONPath - {str(e)}')
+                                    assertion_failures.append(('Should have at least 1 page: JSONPath expression returned None', ()))
+                            except Exception as e:
+                                assertion_failures.append(('Should have at least 1 page: error evaluating JSONPath - %s', (e,)))
+
+                            # JSONPath assertion: $.info.count
+                            try:
+                                json_value = json_path_value_2
+                                if json_value is not None:
+
+                                    # Handle min/max comparison - check length if it's a list, otherwise compare directly
+                                    if isinstance(json_value, list):
+                                        if len(json_value) < 1:
+                                            assertion_failures.append(('Should have at least 1 character: list has %d items, which is below minimum 1', (len(json_value),)))
+                                    else:
+                                        if json_value < 1:
+                                            assertion_failures.append(('Should have at least 1 character: value %s is below minimum 1', (json_value,)))
 
-                        # JSONPath assertion: $.info.count
-                        try:
-                            json_value = self._extract_json_path(response.json(), '$.info.count')
-                            if json_value is not None:
-
-                                # Handle min comparison - check length if it's a list, otherwise compare directly
-                                if isinstance(json_value, list):
-                                    if len(json_value) < 1:
-                                        assertion_failures.append(f'Should have at least 1 character: list has {len(json_value)} items, which is below minimum 1')
                                 else:
-                                    if json_value < 1:
-                                        assertion_failures.append(f'Should have at least 1 character: value {json_value} is below minimum 1')
-
-                            else:
-                                assertion_failures.append(f'Should have at least 1 character: JSONPath expression returned None')
-                        except Exception as e:
-                            assertion_failures.append(f'Should have at least 1 character: error evaluating JSONPath - {str(e)}')
-
-                        # Response time assertion
-                        if response.elapsed.total_seconds() * 1000 > 5000:
-                            assertion_failures.append(f'Response should complete within 5 seconds: response time {response.elapsed.total_seconds() * 1000:.0f}ms exceeds 5000ms')
+                                    assertion_failures.append(('Should have at least 1 character: JSONPath expression returned None', ()))
+                            except Exception as e:
+                                assertion_failures.append(('Should have at least 1 character: error evaluating JSONPath - %s', (e,)))
 
                         # Report assertion failures
                         if assertion_failures:
-                            failure_message = '; '.join(assertion_failures)
-                            response.failure(f'Assertions failed: {failure_message}')
-                            self.logger.error(f'Assertions failed: {failure_message}')
-                        else:
-                            self.logger.info('All assertions passed')
-
-        except Exception as e:
-            self.logger.error(f'Error in API call: {str(e)}')
+                            failure_message = 'Assertions failed: ' + '; '.join(template % args for template, args in assertion_failures)
+                            response.failure(failure_message)
+                            logger.error(failure_message)
+                        elif info_enabled:
+                            logger.info('All assertions passed')
+
+        except LOCUST_CONTROL_EXCEPTIONS:
+            raise
+        except Exception:
+            # A failing step is logged with its traceback and the scenario moves on to the next step
+            logger.exception('Error in API call for step %s', 'Get Characters List - Extract Total Pages')
+    
 
-        # Step: Get Random Page of Characters
+    def _step_get_random_page(self):
+        """Step: Get Random Page of Characters"""
+        info_enabled = logger.isEnabledFor(logging.INFO)
         try:
-            url = self.replace_variables('/api/character/')
-            headers = {}
-            headers['Content-Type'] = self.replace_variables('application/json')
+            url = '/api/character/'
+            headers = STATIC_HEADERS_1
 
-            headers['Accept'] = 'application/json'
-            
             # Prepare request parameters
-            params = {}
-            params['page'] = self.replace_variables('{{random(1, total_pages)}}')
-            body = None
+            params = {'page': self._random('1', 'total_pages')}
 
             with self.client.get(
                 url,
                 headers=headers,
                 params=params,
-                json=body,
                 catch_response=True) as response:
 
-                        # Extract variables from response
+                        # Parse the response body once for extraction and assertions
                         try:
-                            response_data = response.json()
+                            response_data = json_loads(response.content)
+                        except (ValueError, TypeError):
+                            response_data = None
+
+                        # Extract variables from response, binding this user's stores once for the whole step
+                        try:
+                            variables = self.variables
+                            array_values = self.array_values
 
                             # Extract character_ids using JSONPath: $.results[*].id
-                            character_ids_value = self._extract_json_path(response_data, '$.results[*].id')
+                            character_ids_value = response_data.get('results') if isinstance(response_data, dict) else None
+                            character_ids_value = [item.get('id') for item in character_ids_value if isinstance(item, dict) and 'id' in item] if isinstance(character_ids_value, list) else None
                             if character_ids_value is not None:
 
-                                # Store as JSON if it's an array, otherwise as string
+                                # Keep arrays as lists for the random helpers, store everything else as a string
                                 if isinstance(character_ids_value, list):
-                                    self.variables['character_ids'] = json.dumps(character_ids_value)
-                                    self.logger.info(f'Extracted array character_ids with {len(character_ids_value)} items')
+                                    variables['character_ids'] = character_ids_value
+                                    array_values['character_ids'] = tuple(map(str, character_ids_value))
+                                    if info_enabled:
+                                        logger.info('Extracted array character_ids with %d items', len(character_ids_value))
                                 else:
-                                    self.variables['character_ids'] = str(character_ids_value)
-                                    self.logger.info(f'Extracted character_ids = {self.variables["character_ids"]}')
+                                    variables['character_ids'] = str(character_ids_value)
+                                    array_values.pop('character_ids', None)
+                                    if info_enabled:
+                                        logger.info('Extracted character_ids = %s', variables['character_ids'])
                             else:
-                                self.logger.warning(f'Failed to extract character_ids using JSONPath: $.results[*].id')
+                                logger.warning('Failed to extract character_ids using JSONPath: $.results[*].id')
 
                             # Extract character_names using JSONPath: $.results[*].name
-                            character_names_value = self._extract_json_path(response_data, '$.results[*].name')
+                            character_names_value = response_data.get('results') if isinstance(response_data, dict) else None
+                            character_names_value = [item.get('name') for item in character_names_value if isinstance(item, dict) and 'name' in item] if isinstance(character_names_value, list) else None
                             if character_names_value is not None:
 
-                                # Store as JSON if it's an array, otherwise as string
+                                # Keep arrays as lists for the random helpers, store everything else as a string
                                 if isinstance(character_names_value, list):
-                                    self.variables['character_names'] = json.dumps(character_names_value)
-                                    self.logger.info(f'Extracted array character_names with {len(character_names_value)} items')
+                                    variables['character_names'] = character_names_value
+                                    array_values['character_names'] = tuple(map(str, character_names_value))
+                                    if info_enabled:
+                                        logger.info('Extracted array character_names with %d items', len(character_names_value))
                                 else:
-                                    self.variables['character_names'] = str(character_names_value)
-                                    self.logger.info(f'Extracted character_names = {self.variables["character_names"]}')
+                                    variables['character_names'] = str(character_names_value)
+                                    array_values.pop('character_names', None)
+                                    if info_enabled:
+                                        logger.info('Extracted character_names = %s', variables['character_names'])
                             else:
-                                self.logger.warning(f'Failed to extract character_names using JSONPath: $.results[*].name')
+                                logger.warning('Failed to extract character_names using JSONPath: $.results[*].name')
 
                             # Extract page_number using JSONPath: $.info.next
-                            page_number_value = self._extract_json_path(response_data, '$.info.next')
+                            page_number_value = response_data.get('info') if isinstance(response_data, dict) else None
+                            page_number_value = page_number_value.get('next') if isinstance(page_number_value, dict) else None
                             if page_number_value is not None:
 
                                 # Apply custom transformation: extract_page_number
                                 page_number_value = self._apply_transform(page_number_value, 'extract_page_number')
 
-                                # Store as JSON if it's an array, otherwise as string
+                                # Keep arrays as lists for the random helpers, store everything else as a string
                                 if isinstance(page_number_value, list):
-                                    self.variables['page_number'] = json.dumps(page_number_value)
-                                    self.logger.info(f'Extracted array page_number with {len(page_number_value)} items')
+                                    variables['page_number'] = page_number_value
+                                    array_values['page_number'] = tuple(map(str, page_number_value))
+                                    if info_enabled:
+                                        logger.info('Extracted array page_number with %d items', len(page_number_value))
                                 else:
-                                    self.variables['page_number'] = str(page_number_value)
-                                    self.logger.info(f'Extracted page_number = {self.variables["page_number"]}')
+                                    variables['page_number'] = str(page_number_value)
+                                    array_values.pop('page_number', None)
+                                    if info_enabled:
+                                        logger.info('Extracted page_number = %s', variables['page_number'])
                             else:
-                                self.logger.warning(f'Failed to extract page_number using JSONPath: $.info.next')
+                                logger.warning('Failed to extract page_number using JSONPath: $.info.next')
 
                         except Exception as e:
-                            self.logger.error(f'Error extracting variables: {{str(e)}}')
+                            logger.error('Error extracting variables: %s', e)
 
-                        # Run assertions
-                        assertion_failures = []
+                        # Run assertions, reusing this user's failure list instead of allocating one per step;
+                        # failures are (template, args) pairs that are only formatted when reported
+                        assertion_failures = self._assertion_failures
+                        assertion_failures.clear()
+                        status_code = response.status_code
+                        elapsed_ms = response.elapsed.total_seconds() * 1000
 
                         # Status code assertion
-                        if response.status_code != 200:
-                            assertion_failures.append(f'Page API should return 200 status: expected 200, got {response.status_code}')
+                        if status_code != 200:
+                            assertion_failures.append(('Page API should return 200 status: expected 200, got %s', (status_code,)))
 
-                        # JSONPath assertion: $.results
-                        try:
-                            json_value = self._extract_json_path(response.json(), '$.results')
-                            if json_value is not None:
+                        # Response time assertion
+                        if elapsed_ms > 5000:
+                            assertion_failures.append(('Response should complete within 5 seconds: response time %.0fms exceeds 5000ms', (elapsed_ms,)))
+
+                        # Body assertions
+                        if status_code == 200:
+                            # JSONPath assertion: $.results
+                            try:
+                                json_value = response_data.get('results') if isinstance(response_data, dict) else None
+                                if json_value is not None:
+
+                                    # Handle min/max comparison - check length if it's a list, otherwise compare directly
+                                    if isinstance(json_value, list):
+                                        if len(json_value) < 1:
+                                            assertion_failures.append(('Should have at least 1 character in results: list has %d items, which is below minimum 1', (len(json_value),)))
+                                    else:
+                                        if json_value < 1:
+                                            assertion_failures.append(('Should have at least 1 character in results: value %s is below minimum 1', (json_value,)))
 
-                                # Handle min comparison - check length if it's a list, otherwise compare directly
-                                if isinstance(json_value, list):
-                                    if len(json_value) < 1:
-                                        assertion_failures.append(f'Should have at least 1 character in results: list has {len(json_value)} items, which is below minimum 1')
                                 else:
-                                    if json_value < 1:
-                                        assertion_failures.append(f'Should have at least 1 character in results: value {json_value} is below minimum 1')
-
-                            else:
-                                assertion_failures.append(f'Should have at least 1 character in results: JSONPath expression returned None')
-                        except Exception as e:
-                            assertion_failures.append(f'Should have at least 1 character in results: error evaluating JSONPath - {str(e)}')
-
-                        # Response time assertion
-                        if response.elapsed.total_seconds() * 1000 > 5000:
-                            assertion_failures.append(f'Response should complete within 5 seconds: response time {response.elapsed.total_seconds() * 1000:.0f}ms exceeds 5000ms')
+                                    assertion_failures.append(('Should have at least 1 character in results: JSONPath expression returned None', ()))
+                            except Exception as e:
+                                assertion_failures.append(('Should have at least 1 character in results: error evaluating JSONPath - %s', (e,)))
 
                         # Report assertion failures
                         if assertion_failures:
-                            failure_message = '; '.join(assertion_failures)
-                            response.failure(f'Assertions failed: {failure_message}')
-                            self.logger.error(f'Assertions failed: {failure_message}')
-                        else:
-                            self.logger.info('All assertions passed')
-
-        except Exception as e:
-            self.logger.error(f'Error in API call: {str(e)}')
+                            failure_message = 'Assertions failed: ' + '; '.join(template % args for template, args in assertion_failures)
+                            response.failure(failure_message)
+                            logger.error(failure_message)
+                        elif info_enabled:
+                            logger.info('All assertions passed')
+
+        except LOCUST_CONTROL_EXCEPTIONS:
+            raise
+        except Exception:
+            # A failing step is logged with its traceback and the scenario moves on to the next step
+            logger.exception('Error in API call for step %s', 'Get Random Page of Characters')
+    
 
-        # Step: Get Random Character Details
+    def _step_get_random_character(self):
+        """Step: Get Random Character Details"""
+        info_enabled = logger.isEnabledFor(logging.INFO)
         try:
-            url = self.replace_variables('/api/character/{{random_from_array(character_ids)}}')
-            headers = {}
-            headers['Content-Type'] = self.replace_variables('application/json')
-
-            headers['Accept'] = 'application/json'
-            
-            # Prepare request parameters
-            params = {}
-            body = None
+            url = '/api/character/' + self._random_from_array('character_ids')
+            headers = STATIC_HEADERS_1
 
             with self.client.get(
                 url,
                 headers=headers,
-                params=params,
-                json=body,
                 catch_response=True) as response:
 
-                        # Extract variables from response
+                        # Parse the response body once for extraction and assertions
                         try:
-                            response_data = response.json()
+                            response_data = json_loads(response.content)
+                        except (ValueError, TypeError):
+                            response_data = None
+
+                        # Evaluate JSONPaths used by both extraction and assertions once
+                        json_path_value_1 = response_data.get('name') if isinstance(response_data, dict) else None
+                        json_path_value_2 = response_data.get('status') if isinstance(response_data, dict) else None
+
+                        # Extract variables from response, binding this user's stores once for the whole step
+                        try:
+                            variables = self.variables
+                            array_values = self.array_values
 
                             # Extract character_name using JSONPath: $.name
-                            character_name_value = self._extract_json_path(response_data, '$.name')
+                            character_name_value = json_path_value_1
                             if character_name_value is not None:
 
-                                # Store as JSON if it's an array, otherwise as string
+                                # Keep arrays as lists for the random helpers, store everything else as a string
                                 if isinstance(character_name_value, list):
-                                    self.variables['character_name'] = json.dumps(character_name_value)
-                                    self.logger.info(f'Extracted array character_name with {len(character_name_value)} items')
+                                    variables['character_name'] = character_name_value
+                                    array_values['character_name'] = tuple(map(str, character_name_value))
+                                    if info_enabled:
+                                        logger.info('Extracted array character_name with %d items', len(character_name_value))
                                 else:
-                                    self.variables['character_name'] = str(character_name_value)
-                                    self.logger.info(f'Extracted character_name = {self.variables["character_name"]}')
+                                    variables['character_name'] = str(character_name_value)
+                                    array_values.pop('character_name', None)
+                                    if info_enabled:
+                                        logger.info('Extracted character_name = %s', variables['character_name'])
                             else:
-                                self.logger.warning(f'Failed to extract character_name using JSONPath: $.name')
+                                logger.warning('Failed to extract character_name using JSONPath: $.name')
 
                             # Extract character_status using JSONPath: $.status
-                            character_status_value = self._extract_json_path(response_data, '$.status')
+                            character_status_value = json_path_value_2
                             if character_status_value is not None:
 
-                                # Store as JSON if it's an array, otherwise as string
+                                # Keep arrays as lists for the random helpers, store everything else as a string
                                 if isinstance(character_status_value, list):
-                                    self.variables['character_status'] = json.dumps(character_status_value)
-                                    self.logger.info(f'Extracted array character_status with {len(character_status_value)} items')
+                                    variables['character_status'] = character_status_value
+                                    array_values['character_status'] = tuple(map(str, character_status_value))
+                                    if info_enabled:
+                                        logger.info('Extracted array character_status with %d items', len(character_status_value))
                                 else:
-                                    self.variables['character_status'] = str(character_status_value)
-                                    self.logger.info(f'Extracted character_status = {self.variables["character_status"]}')
+                                    variables['character_status'] = str(character_status_value)
+                                    array_values.pop('character_status', None)
+                                    if info_enabled:
+                                        logger.info('Extracted character_status = %s', variables['character_status'])
                             else:
-                                self.logger.warning(f'Failed to extract character_status using JSONPath: $.status')
+                                logger.warning('Failed to extract character_status using JSONPath: $.status')
 
                             # Extract character_species using JSONPath: $.species
-                            character_species_value = self._extract_json_path(response_data, '$.species')
+                            character_species_value = response_data.get('species') if isinstance(response_data, dict) else None
                             if character_species_value is not None:
 
-                                # Store as JSON if it's an array, otherwise as string
+                                # Keep arrays as lists for the random helpers, store everything else as a string
                                 if isinstance(character_species_value, list):
-                                    self.variables['character_species'] = json.dumps(character_species_value)
-                                    self.logger.info(f'Extracted array character_species with {len(character_species_value)} items')
+                                    variables['character_species'] = character_species_value
+                                    array_values['character_species'] = tuple(map(str, character_species_value))
+                                    if info_enabled:
+                                        logger.info('Extracted array character_species with %d items', len(character_species_value))
                                 else:
-                                    self.variables['character_species'] = str(character_species_value)
-                                    self.logger.info(f'Extracted character_species = {self.variables["character_species"]}')
+                                    variables['character_species'] = str(character_species_value)
+                                    array_values.pop('character_species', None)
+                                    if info_enabled:
+                                        logger.info('Extracted character_species = %s', variables['character_species'])
                             else:
-                                self.logger.warning(f'Failed to extract character_species using JSONPath: $.species')
+                                logger.warning('Failed to extract character_species using JSONPath: $.species')
 
                             # Extract character_origin using JSONPath: $.origin.name
-                            character_origin_value = self._extract_json_path(response_data, '$.origin.name')
+                            character_origin_value = response_data.get('origin') if isinstance(response_data, dict) else None
+                            character_origin_value = character_origin_value.get('name') if isinstance(character_origin_value, dict) else None
                             if character_origin_value is not None:
 
-                                # Store as JSON if it's an array, otherwise as string
+                                # Keep arrays as lists for the random helpers, store everything else as a string
                                 if isinstance(character_origin_value, list):
-                                    self.variables['character_origin'] = json.dumps(character_origin_value)
-                                    self.logger.info(f'Extracted array character_origin with {len(character_origin_value)} items')
+                                    variables['character_origin'] = character_origin_value
+                                    array_values['character_origin'] = tuple(map(str, character_origin_value))
+                                    if info_enabled:
+                                        logger.info('Extracted array character_origin with %d items', len(character_origin_value))
                                 else:
-                                    self.variables['character_origin'] = str(character_origin_value)
-                                    self.logger.info(f'Extracted character_origin = {self.variables["character_origin"]}')
+                                    variables['character_origin'] = str(character_origin_value)
+                                    array_values.pop('character_origin', None)
+                                    if info_enabled:
+                                        logger.info('Extracted character_origin = %s', variables['character_origin'])
                             else:
-                                self.logger.warning(f'Failed to extract character_origin using JSONPath: $.origin.name')
+                                logger.warning('Failed to extract character_origin using JSONPath: $.origin.name')
 
                         except Exception as e:
-                            self.logger.error(f'Error extracting variables: {{str(e)}}')
+                            logger.error('Error extracting variables: %s', e)
 
-                        # Run assertions
-                        assertion_failures = []
+                        # Run assertions, reusing this user's failure list instead of allocating one per step;
+                        # failures are (template, args) pairs that are only formatted when reported
+                        assertion_failures = self._assertion_failures
+                        assertion_failures.clear()
+                        status_code = response.status_code
+                        elapsed_ms = response.elapsed.total_seconds() * 1000
 
                         # Status code assertion
-                        if response.status_code != 200:
-                            assertion_failures.append(f'Character API should return 200 status: expected 200, got {response.status_code}')
+                        if status_code != 200:
+                            assertion_failures.append(('Character API should return 200 status: expected 200, got %s', (status_code,)))
 
-                        # JSONPath assertion: $.id
-                        try:
-                            json_value = self._extract_json_path(response.json(), '$.id')
-                            if json_value is not None:
+                        # Response time assertion
+                        if elapsed_ms > 3000:
+                            assertion_failures.append(('Response should complete within 3 seconds: response time %.0fms exceeds 3000ms', (elapsed_ms,)))
+
+                        # Body assertions
+                        if status_code == 200:
+                            # JSONPath assertion: $.id
+                            try:
+                                json_value = response_data.get('id') if isinstance(response_data, dict) else None
+                                if json_value is not None:
+
+                                    # Handle min/max comparison - check length if it's a list, otherwise compare directly
+                                    if isinstance(json_value, list):
+                                        if len(json_value) < 1:
+                                            assertion_failures.append(('Character should have a valid ID: list has %d items, which is below minimum 1', (len(json_value),)))
+                                    else:
+                                        if json_value < 1:
+                                            assertion_failures.append(('Character should have a valid ID: value %s is below minimum 1', (json_value,)))
 
-                                # Handle min comparison - check length if it's a list, otherwise compare directly
-                                if isinstance(json_value, list):
-                                    if len(json_value) < 1:
-                                        assertion_failures.append(f'Character should have a valid ID: list has {len(json_value)} items, which is below minimum 1')
                                 else:
-                                    if json_value < 1:
-                                        assertion_failures.append(f'Character should have a valid ID: value {json_value} is below minimum 1')
-
-                            else:
-                                assertion_failures.append(f'Character should have a valid ID: JSONPath expression returned None')
-                        except Exception as e:
-                            assertion_failures.append(f'Character should have a valid ID: error evaluating JSONPath - {str(e)}')
+                                    assertion_failures.append(('Character should have a valid ID: JSONPath expression returned None', ()))
+                            except Exception as e:
+                                assertion_failures.append(('Character should have a valid ID: error evaluating JSONPath - %s', (e,)))
 
-                        # JSONPath assertion: $.name
-                        try:
-                            json_value = self._extract_json_path(response.json(), '$.name')
-                            if json_value is not None:
-
-                                # JSONPath value exists and is valid
-                                self.logger.info(f'JSONPath assertion passed: {json_value}')
+                            # JSONPath assertion: $.name
+                            try:
+                                json_value = json_path_value_1
+                                if json_value is not None:
 
-                            else:
-                                assertion_failures.append(f'Character should have a name: JSONPath expression returned None')
-                        except Exception as e:
-                            assertion_failures.append(f'Character should have a name: error evaluating JSONPath - {str(e)}')
+                                    # JSONPath value exists and is valid
+                                    if info_enabled:
+                                        logger.info('JSONPath assertion passed: %s', json_value)
 
-                        # JSONPath assertion: $.status
-                        try:
-                            json_value = self._extract_json_path(response.json(), '$.status')
-                            if json_value is not None:
+                                else:
+                                    assertion_failures.append(('Character should have a name: JSONPath expression returned None', ()))
+                            except Exception as e:
+                                assertion_failures.append(('Character should have a name: error evaluating JSONPath - %s', (e,)))
 
-                                # JSONPath value exists and is valid
-                                self.logger.info(f'JSONPath assertion passed: {json_value}')
+                            # JSONPath assertion: $.status
+                            try:
+                                json_value = json_path_value_2
+                                if json_value is not None:
 
-                            else:
-                                assertion_failures.append(f'Character status should be valid: JSONPath expression returned None')
-                        except Exception as e:
-                            assertion_failures.append(f'Character status should be valid: error evaluating JSONPath - {str(e)}')
+                                    # JSONPath value exists and is valid
+                                    if info_enabled:
+                                        logger.info('JSONPath assertion passed: %s', json_value)
 
-                        # Response time assertion
-                        if response.elapsed.total_seconds() * 1000 > 3000:
-                            assertion_failures.append(f'Response should complete within 3 seconds: response time {response.elapsed.total_seconds() * 1000:.0f}ms exceeds 3000ms')
+                                else:
+                                    assertion_failures.append(('Character status should be valid: JSONPath expression returned None', ()))
+                            except Exception as e:
+                                assertion_failures.append(('Character status should be valid: error evaluating JSONPath - %s', (e,)))
 
                         # Report assertion failures
                         if assertion_failures:
-                            failure_message = '; '.join(assertion_failures)
-                            response.failure(f'Assertions failed: {failure_message}')
-                            self.logger.error(f'Assertions failed: {failure_message}')
-                        else:
-                            self.logger.info('All assertions passed')
-
-        except Exception as e:
-            self.logger.error(f'Error in API call: {str(e)}')
+                            failure_message = 'Assertions failed: ' + '; '.join(template % args for template, args in assertion_failures)
+                            response.failure(failure_message)
+                            logger.error(failure_message)
+                        elif info_enabled:
+                            logger.info('All assertions passed')
+
+        except LOCUST_CONTROL_EXCEPTIONS:
+            raise
+        except Exception:
+            # A failing step is logged with its traceback and the scenario moves on to the next step
+            logger.exception('Error in API call for step %s', 'Get Random Character Details')
+    
 
-        # Step: Get Multiple Random Characters
+    def _step_get_multiple_characters(self):
+        """Step: Get Multiple Random Characters"""
+        info_enabled = logger.isEnabledFor(logging.INFO)
         try:
-            url = self.replace_variables('/api/character/{{random_subset_from_array(character_ids, 3)}}')
-            headers = {}
-            headers['Content-Type'] = self.replace_variables('application/json')
-
-            headers['Accept'] = 'application/json'
-            
-            # Prepare request parameters
-            params = {}
-            body = None
+            url = '/api/character/' + self._random_subset_from_array('character_ids', 3)
+            headers = STATIC_HEADERS_1
 
             with self.client.get(
                 url,
                 headers=headers,
-                params=params,
-                json=body,
                 catch_response=True) as response:
 
-                        # Run assertions
-                        assertion_failures = []
+                        # Run assertions, reusing this user's failure list instead of allocating one per step;
+                        # failures are (template, args) pairs that are only formatted when reported
+                        assertion_failures = self._assertion_failures
+                        assertion_failures.clear()
+                        status_code = response.status_code
 
                         # Status code assertion
-                        if response.status_code != 200:
-                            assertion_failures.append(f'Multiple characters API should return 200 status: expected 200, got {response.status_code}')
+                        if status_code != 200:
+                            assertion_failures.append(('Multiple characters API should return 200 status: expected 200, got %s', (status_code,)))
 
                         # Report assertion failures
                         if assertion_failures:
-                            failure_message = '; '.join(assertion_failures)
-                            response.failure(f'Assertions failed: {failure_message}')
-                            self.logger.error(f'Assertions failed: {failure_message}')
-                        else:
-                            self.logger.info('All assertions passed')
-
-        except Exception as e:
-            self.logger.error(f'Error in API call: {str(e)}')
+                            failure_message = 'Assertions failed: ' + '; '.join(template % args for template, args in assertion_failures)
+                            response.failure(failure_message)
+                            logger.error(failure_message)
+                        elif info_enabled:
+                            logger.info('All assertions passed')
+
+        except LOCUST_CONTROL_EXCEPTIONS:
+            raise
+        except Exception:
+            # A failing step is logged with its traceback and the scenario moves on to the next step
+            logger.exception('Error in API call for step %s', 'Get Multiple Random Characters')
+    
+    @task
+    def run_scenario(self):
+        """Execute the complete test scenario"""
+        self._step_get_characters_list()
+        self._step_get_random_page()
+        self._step_get_random_character()
+        self._step_get_multiple_characters()
 
@@ -5,6 +5,18 @@ Simple script to run the Locust AI Agent example
 import sys
 import os
 import json
+from pathlib import Path
+
+try:
+    from orjson import loads as json_loads, dumps as orjson_dumps, OPT_INDENT_2
+
+    def json_dumps_indented(value):
+        return orjson_dumps(value, option=OPT_INDENT_2)
+except ImportError:
+    from json import loads as json_loads
+
+    def json_dumps_indented(value):
+        return json.dumps(value, indent=2).encode('utf-8')
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -29,12 +41,10 @@ def main():
     test_config_path = "examples/sample_test_config.json"
     
     print(f"Loading scenario from: {scenario_path}")
-    with open(scenario_path, 'r') as f:
-        scenario_config = json.load(f)
+    scenario_config = json_loads(Path(scenario_path).read_bytes())
     
     print(f"Loading test config from: {test_config_path}")
-    with open(test_config_path, 'r') as f:
-        test_config_data = json.load(f)
+    test_config_data = json_loads(Path(test_config_path).read_bytes())
     
     # Create test configuration object
     test_config = TestConfig(
@@ -77,8 +87,7 @@ def main():
             print(f"CSV Report: {workflow_result['csv_report_path']}")
         
         # Save results
-        with open("test_results.json", "w") as f:
-            json.dump(workflow_result, f, indent=2)
+        Path("test_results.json").write_bytes(json_dumps_indented(workflow_result))
         print("Results saved to: test_results.json")
         
         print("="*60)
@@ -0,0 +1,198 @@
+"""
+Tests for the command-line interface.
+
+The CLI uses package-relative imports, so each test runs Python in a
+subprocess against a Locust_AI_Agent symlink pointing at the repository.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def run_python(tmp_path):
+    """Run a snippet with the repository importable as Locust_AI_Agent, from tmp_path"""
+    package_dir = tmp_path / 'site'
+    package_dir.mkdir()
+    (package_dir / 'Locust_AI_Agent').symlink_to(REPO_ROOT, target_is_directory=True)
+    env = dict(os.environ, PYTHONPATH=str(package_dir))
+
+    def run(code):
+        result = subprocess.run(
+            [sys.executable, '-c', textwrap.dedent(code)],
+            cwd=tmp_path, env=env, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+        return result.stdout
+
+    return run
+
+
+# Replaces the test agent with one that records its TestConfig and logs heavily
+RUN_TEST_PRELUDE = """
+import json, logging, sys
+from dataclasses import asdict
+import Locust_AI_Agent.core.test_agent as test_agent
+from Locust_AI_Agent.utils import cli
+
+class FakeAgent:
+    def __init__(self, workspace_dir=None):
+        pass
+
+    def run_complete_workflow(self, scenario_config, test_config):
+        with open('recorded_config.json', 'w') as f:
+            json.dump(asdict(test_config), f)
+        for index in range(2000):
+            logging.getLogger('fake_agent').info('workflow log line %d', index)
+        return {
+            'scenario_name': test_config.scenario_name,
+            'workflow_success': True,
+            'script_path': 'script.py',
+            'test_result': {'success': True}
+        }
+
+test_agent.LocustTestAgent = FakeAgent
+"""
+
+
+@pytest.fixture
+def run_test_command(tmp_path, run_python):
+    """Run the run-test subcommand with a fake agent and the given extra arguments"""
+    (tmp_path / 'scenario.json').write_text('{"name": "Sample Scenario"}', encoding='utf-8')
+    (tmp_path / 'test_config.json').write_text(
+        '{"host": "https://api.example.com", "users": 5, "not_a_field": 1}', encoding='utf-8'
+    )
+
+    def run(*extra_args):
+        argv = ['locust-ai-agent', 'run-test', '--scenario-config', 'scenario.json',
+                '--test-config', 'test_config.json', *extra_args]
+        return run_python(RUN_TEST_PRELUDE + f"sys.argv = {argv!r}\ncli.main()\n")
+
+    return run
+
+
+def test_log_records_reach_the_log_file(tmp_path, run_test_command):
+    run_test_command('--verbose')
+
+    log_text = (tmp_path / 'ai_agent.log').read_text(encoding='utf-8')
+    assert 'fake_agent - INFO - workflow log line 0' in log_text
+    assert 'workflow log line 1999' in log_text
+
+
+def test_test_config_uses_known_fields_and_dataclass_defaults(tmp_path, run_test_command):
+    run_test_command()
+
+    recorded = json.loads((tmp_path / 'recorded_config.json').read_text(encoding='utf-8'))
+    assert recorded['scenario_name'] == 'Sample Scenario'
+    assert recorded['host'] == 'https://api.example.com'
+    assert recorded['users'] == 5
+    assert recorded['spawn_rate'] == 1
+    assert recorded['assertions'] == [] and recorded['headers'] == {}
+    assert recorded['body'] == {}
+    assert recorded['use_enhanced_generator'] is True
+    assert 'not_a_field' not in recorded
+
+
+def test_test_config_honours_use_enhanced_generator(tmp_path, run_test_command):
+    (tmp_path / 'test_config.json').write_text(
+        '{"host": "https://api.example.com", "use_enhanced_generator": false}', encoding='utf-8'
+    )
+    run_test_command()
+
+    recorded = json.loads((tmp_path / 'recorded_config.json').read_text(encoding='utf-8'))
+    assert recorded['use_enhanced_generator'] is False
+
+
+def test_results_file_is_compact_unless_pretty(tmp_path, run_test_command):
+    run_test_command('--output-file', 'compact.json')
+    run_test_command('--output-file', 'pretty.json', '--pretty')
+
+    compact = (tmp_path / 'compact.json').read_text(encoding='utf-8')
+    pretty = (tmp_path / 'pretty.json').read_text(encoding='utf-8')
+    assert '\n' not in compact and ', ' not in compact
+    assert pretty.startswith('{\n  "scenario_name": "Sample Scenario"')
+    assert json.loads(compact) == json.loads(pretty)
+
+
+def test_importing_cli_does_not_load_agent_dependencies(run_python):
+    output = run_python("""
+        import sys
+        from Locust_AI_Agent.utils import cli
+        print(sorted(name for name in ('locust', 'requests') if name in sys.modules))
+    """)
+    assert output.strip() == '[]'
+
+
+def test_package_exports_resolve_lazily(run_python):
+    output = run_python("""
+        import Locust_AI_Agent
+        from Locust_AI_Agent import TestConfig, MockLLMAnalyzer
+        from Locust_AI_Agent.core import LocustTestAgent
+        print(TestConfig.__module__, MockLLMAnalyzer.__module__, LocustTestAgent.__name__)
+    """)
+    assert output.split() == [
+        'Locust_AI_Agent.core.test_agent', 'Locust_AI_Agent.analysis.llm_analyzer', 'LocustTestAgent'
+    ]
+
+
+def test_summary_is_printed_after_all_log_records(run_test_command):
+    output = run_test_command()
+
+    lines = output.splitlines()
+    summary_start = lines.index('TEST WORKFLOW SUMMARY')
+    last_log_line = max(index for index, line in enumerate(lines) if 'workflow log line' in line)
+    assert 'workflow log line 1999' in lines[last_log_line]
+    assert last_log_line < summary_start
+    assert lines[summary_start:] == [
+        'TEST WORKFLOW SUMMARY', '=' * 60, 'Scenario: Sample Scenario', 'Success: True', 'Script: script.py', '=' * 60
+    ]
+
+
+def test_create_samples_writes_newline_terminated_json(tmp_path, run_python):
+    run_python("""
+        import sys
+        from Locust_AI_Agent.utils import cli
+        sys.argv = ['locust-ai-agent', 'create-samples']
+        cli.main()
+    """)
+
+    scenario_bytes = (tmp_path / 'sample_scenario_config.json').read_bytes()
+    test_config_bytes = (tmp_path / 'sample_test_config.json').read_bytes()
+    for content in (scenario_bytes, test_config_bytes):
+        assert content.startswith(b'{\n  "')
+        assert content.endswith(b'}\n')
+    assert json.loads(scenario_bytes)['name'] == 'Sample API Test'
+    assert json.loads(test_config_bytes)['scenario_name'] == 'Sample API Test'
+
+
+def test_llm_analyzer_is_closed_when_analysis_fails(tmp_path, run_python, run_test_command):
+    run_python(RUN_TEST_PRELUDE + """
+import Locust_AI_Agent.analysis.llm_analyzer as llm_analyzer
+
+class FailingAnalyzer(llm_analyzer.MockLLMAnalyzer):
+    def analyze_test_results(self, test_result, html_report_path=None):
+        raise RuntimeError('analysis failed')
+
+    def close(self):
+        open('analyzer_closed', 'w').close()
+        super().close()
+
+llm_analyzer.MockLLMAnalyzer = FailingAnalyzer
+sys.argv = ['locust-ai-agent', 'run-test', '--scenario-config', 'scenario.json',
+            '--test-config', 'test_config.json', '--use-llm', '--mock-llm']
+try:
+    cli.main()
+except SystemExit as exit_error:
+    with open('exit_code', 'w') as f:
+        f.write(str(exit_error.code))
+""")
+
+    assert (tmp_path / 'analyzer_closed').exists()
+    assert (tmp_path / 'exit_code').read_text(encoding='utf-8') == '1'
@@ -0,0 +1,265 @@
+"""
+Tests for the enhanced script generator.
+
+Each test generates a Locust script from a small scenario, imports it against
+stub locust modules and runs it with a stub HTTP client.
+"""
+
+import datetime
+import importlib.util
+import json
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.enhanced_script_generator import EnhancedScriptGenerator
+
+
+class StubResponse:
+    """Minimal stand-in for the response yielded by catch_response=True"""
+
+    def __init__(self, status_code=200, data=None, content=b'', elapsed_ms=50):
+        self.status_code = status_code
+        self.content = json.dumps(data).encode('utf-8') if data is not None else content
+        self.text = self.content.decode('utf-8') if self.content is not None else ''
+        self.elapsed = datetime.timedelta(milliseconds=elapsed_ms)
+        self.failures = []
+        self.successes = 0
+
+    def failure(self, message):
+        self.failures.append(message)
+
+    def success(self):
+        self.successes += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class StubClient:
+    """Records every request and answers with the configured StubResponse"""
+
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        for name, value in (kwargs.get('headers') or {}).items():
+            # requests raises InvalidHeader for anything but str/bytes header values
+            assert isinstance(value, (str, bytes)), f"header {name} has non-str value {value!r}"
+        self.calls.append((method, url, kwargs))
+        return self.response
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+
+def _install_stub_locust(monkeypatch):
+    locust = types.ModuleType('locust')
+    exception = types.ModuleType('locust.exception')
+
+    class HttpUser:
+        def __init__(self, client):
+            self.client = client
+
+    locust.HttpUser = HttpUser
+    locust.task = lambda function: function
+    locust.between = lambda low, high: (lambda self: low)
+    for name in ('InterruptTaskSet', 'RescheduleTask', 'RescheduleTaskImmediately', 'StopUser'):
+        setattr(exception, name, type(name, (Exception,), {}))
+    locust.exception = exception
+    monkeypatch.setitem(sys.modules, 'locust', locust)
+    monkeypatch.setitem(sys.modules, 'locust.exception', exception)
+
+
+def generate_script(tmp_path, scenario):
+    scenario_file = tmp_path / 'scenario.json'
+    scenario_file.write_text(json.dumps(scenario), encoding='utf-8')
+    output_file = tmp_path / 'generated_script.py'
+    EnhancedScriptGenerator(str(scenario_file), str(output_file)).generate_script()
+    return output_file
+
+
+def load_user(tmp_path, monkeypatch, scenario, response):
+    """Generate, compile and import a scenario, returning a user bound to a stub client"""
+    _install_stub_locust(monkeypatch)
+    script_path = generate_script(tmp_path, scenario)
+    spec = importlib.util.spec_from_file_location('generated_script', script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    user_class = next(
+        value for value in vars(module).values()
+        if isinstance(value, type) and value.__module__ == 'generated_script' and hasattr(value, 'run_scenario')
+    )
+    user = user_class(StubClient(response))
+    user.on_start()
+    return user
+
+
+def make_scenario(**step):
+    step.setdefault('id', 'only_step')
+    step.setdefault('name', 'Only Step')
+    step.setdefault('method', 'GET')
+    step.setdefault('url', '/api/items')
+    step.setdefault('assertions', [{'type': 'status_code', 'expected': 200}])
+    return {'name': 'Generator Test', 'base_url': 'http://localhost', 'steps': [step]}
+
+
+def test_response_body_is_parsed_with_orjson_when_available(tmp_path, monkeypatch):
+    orjson = pytest.importorskip('orjson')
+    user = load_user(tmp_path, monkeypatch, make_scenario(), StubResponse(data={}))
+    assert type(user).on_start.__globals__['json_loads'] is orjson.loads
+
+
+def test_response_body_falls_back_to_json_without_orjson(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'orjson', None)
+    user = load_user(tmp_path, monkeypatch, make_scenario(), StubResponse(data={}))
+    assert type(user).on_start.__globals__['json_loads'] is json.loads
+
+
+def test_json_path_extraction_is_inlined_on_the_parsed_body(tmp_path, monkeypatch):
+    scenario = make_scenario(extract={'item_id': {'type': 'json_path', 'expression': '$.data.id'}})
+    user = load_user(tmp_path, monkeypatch, scenario, StubResponse(data={'data': {'id': 42}}))
+
+    user.run_scenario()
+
+    assert str(user.variables['item_id']) == '42'
+    script = (tmp_path / 'generated_script.py').read_text(encoding='utf-8')
+    # Simple JSONPaths are walked inline on the parsed body instead of through a runtime helper
+    assert "response_data.get('data')" in script
+
+
+def test_each_user_draws_from_its_own_random_generator(tmp_path, monkeypatch):
+    scenario = make_scenario(params={'id': '{{random(1,1000000)}}'})
+    first_user = load_user(tmp_path, monkeypatch, scenario, StubResponse(data={}))
+    second_user = load_user(tmp_path, monkeypatch, scenario, StubResponse(data={}))
+    assert first_user._rng is not second_user._rng
+
+    first_user._rng.seed(7)
+    second_user._rng.seed(7)
+    first_user.run_scenario()
+    second_user.run_scenario()
+
+    (_, _, first), = first_user.client.calls
+    (_, _, second), = second_user.client.calls
+    assert first['params'] == second['params']
+    assert 1 <= int(first['params']['id']) <= 1000000
+
+
+def test_steps_run_in_order_and_share_extracted_variables(tmp_path, monkeypatch):
+    scenario = make_scenario(
+        id='list-items', name='List Items', extract={'item_id': {'type': 'json_path', 'expression': '$.id'}}
+    )
+    scenario['steps'].append({
+        'id': 'Fetch Item', 'name': 'Fetch Item', 'method': 'GET', 'url': '/api/items/{item_id}',
+        'assertions': [{'type': 'status_code', 'expected': 200}]
+    })
+    user = load_user(tmp_path, monkeypatch, scenario, StubResponse(data={'id': 42}))
+
+    user.run_scenario()
+
+    assert [url for _, url, _ in user.client.calls] == ['/api/items', '/api/items/42']
+    assert hasattr(user, '_step_list_items') and hasattr(user, '_step_fetch_item')
+
+
+def test_static_request_parts_are_built_once_per_module(tmp_path, monkeypatch):
+    scenario = make_scenario(method='POST', params={'page': 1}, body={'name': 'widget'})
+    user = load_user(tmp_path, monkeypatch, scenario, StubResponse(data={}))
+
+    user.run_scenario()
+    user.run_scenario()
+
+    (_, _, first), (_, _, second) = user.client.calls
+    assert first['params'] == {'page': 1} and first['json'] == {'name': 'widget'}
+    assert first['params'] is second['params'] and first['json'] is second['json']
+    script = (tmp_path / 'generated_script.py').read_text(encoding='utf-8')
+    assert "STATIC_PARAMS_1 = {'page': 1}" in script
+    assert "STATIC_BODY_1 = {'name': 'widget'}" in script
+
+
+def test_static_headers_are_sent_as_strings(tmp_path, monkeypatch):
+    scenario = make_scenario(headers={'X-Retry': 3, 'X-Debug': True, 'Content-Type': 'application/json'})
+    user = load_user(tmp_path, monkeypatch, scenario, StubResponse(data={}))
+
+    user.run_scenario()
+
+    (_, _, kwargs), = user.client.calls
+    assert kwargs['headers'] == {
+        'X-Retry': '3', 'X-Debug': 'True', 'Content-Type': 'application/json', 'Accept': 'application/json'
+    }
+
+
+def test_templated_headers_are_sent_as_strings(tmp_path, monkeypatch):
+    scenario = make_scenario(headers={'X-Retry': 3, 'X-Page': '{{random(1,1)}}'})
+    user = load_user(tmp_path, monkeypatch, scenario, StubResponse(data={}))
+
+    user.run_scenario()
+
+    (_, _, kwargs), = user.client.calls
+    assert kwargs['headers'] == {'X-Retry': '3', 'X-Page': '1', 'Accept': 'application/json'}
+
+
+def test_missing_body_fails_assertions_without_the_json_fallback(tmp_path, monkeypatch, caplog):
+    # Force the stdlib json fallback, whose loads raises TypeError for a None body
+    monkeypatch.setitem(sys.modules, 'orjson', None)
+    scenario = make_scenario(
+        extract={'item_id': {'type': 'json_path', 'expression': '$.id'}},
+        assertions=[{'type': 'json_path', 'expression': '$.id', 'expected': 7}]
+    )
+    response = StubResponse(content=None)
+    user = load_user(tmp_path, monkeypatch, scenario, response)
+
+    user.run_scenario()
+
+    assert 'Error in API call' not in caplog.text
+    assert len(response.failures) == 1
+    assert 'item_id' not in user.variables
+
+
+def test_regex_extraction_uses_precompiled_pattern(tmp_path, monkeypatch):
+    scenario = make_scenario(extract={'session_id': {'type': 'regex', 'expression': 'session=([a-z0-9]+)'}})
+    user = load_user(tmp_path, monkeypatch, scenario, StubResponse(content=b'ok session=abc123 done'))
+
+    user.run_scenario()
+
+    assert user.variables['session_id'] == 'abc123'
+    script = (tmp_path / 'generated_script.py').read_text(encoding='utf-8')
+    assert "REGEX_PATTERN_1 = re.compile(r'session=([a-z0-9]+)')" in script
+    assert '_extract_regex' not in script
+
+
+def test_body_assertions_run_when_any_expected_status_matches(tmp_path, monkeypatch):
+    scenario = make_scenario(assertions=[
+        {'type': 'status_code', 'expected': 200},
+        {'type': 'status_code', 'expected': 201},
+        {'type': 'json_path', 'expression': '$.id', 'expected': 7, 'description': 'Item id'}
+    ])
+    response = StubResponse(status_code=201, data={'id': 8})
+    user = load_user(tmp_path, monkeypatch, scenario, response)
+
+    user.run_scenario()
+
+    failure, = response.failures
+    assert 'expected 200, got 201' in failure
+    assert 'Item id' in failure
+
+
+def test_reversed_constant_random_bounds_fall_back_to_one(tmp_path, monkeypatch, caplog):
+    scenario = make_scenario(params={'page': '{{random(10,1)}}', 'size': '{{random(5,5)}}'})
+    user = load_user(tmp_path, monkeypatch, scenario, StubResponse(data={}))
+
+    user.run_scenario()
+
+    assert 'Error in API call' not in caplog.text
+    (_, _, kwargs), = user.client.calls
+    assert kwargs['params'] == {'page': '1', 'size': '5'}
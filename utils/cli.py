@@ -2,44 +2,71 @@
 Command-line interface for the Locust AI Agent.
 """
 import argparse
+import atexit
 import json
 import os
+import queue
 import sys
 import logging
+from dataclasses import fields
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Dict, Any
 
-from ..core.test_agent import LocustTestAgent, TestConfig
-from ..analysis.llm_analyzer import LLMAnalyzer, MockLLMAnalyzer
+try:
+    from orjson import loads as json_loads, dumps as orjson_dumps, OPT_INDENT_2
 
+    def json_dumps_compact(value) -> bytes:
+        return orjson_dumps(value)
 
-def setup_logging(verbose: bool = False):
-    """Setup logging configuration."""
+    def json_dumps_indented(value) -> bytes:
+        return orjson_dumps(value, option=OPT_INDENT_2)
+except ImportError:
+    from json import loads as json_loads
+
+    def json_dumps_compact(value) -> bytes:
+        return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+    def json_dumps_indented(value) -> bytes:
+        return json.dumps(value, indent=2).encode('utf-8')
+
+
+def setup_logging(verbose: bool = False) -> QueueListener:
+    """Setup logging configuration and return the running listener."""
     level = logging.DEBUG if verbose else logging.INFO
+    # Records are formatted by the QueueHandler and written to stdout and
+    # the log file from the listener thread, off the workflow thread.
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue,
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler('ai_agent.log', delay=True)
+    )
+    # force=True replaces the default handler core.test_agent installs on import
     logging.basicConfig(
         level=level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('ai_agent.log')
-        ]
+        handlers=[QueueHandler(log_queue)],
+        force=True
     )
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
 
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """Load configuration from JSON file."""
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return json_loads(Path(config_path).read_bytes())
     except Exception as e:
         raise ValueError(f"Error loading config file {config_path}: {e}")
 
 
-def save_results(results: Dict[str, Any], output_path: str):
-    """Save results to JSON file."""
+def save_results(results: Dict[str, Any], output_path: str, pretty: bool = False):
+    """Save results to JSON file, indented only when pretty is set."""
     try:
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(json_dumps_indented(results) if pretty else json_dumps_compact(results))
         print(f"Results saved to: {output_path}")
     except Exception as e:
         print(f"Error saving results: {e}")
@@ -47,7 +74,10 @@ def save_results(results: Dict[str, Any], output_path: str):
 
 def run_test_workflow(args):
     """Run the complete test workflow."""
-    setup_logging(args.verbose)
+    # Imported here so --help and create-samples don't pay for Locust/requests
+    from ..core.test_agent import LocustTestAgent, TestConfig
+
+    log_listener = setup_logging(args.verbose)
     logger = logging.getLogger(__name__)
     
     try:
@@ -60,24 +90,13 @@ def run_test_workflow(args):
         test_config_data = load_config(args.test_config)
         
         # Create test configuration object
-        test_config = TestConfig(
-            scenario_name=test_config_data.get("scenario_name", scenario_config.get("name", "Unknown")),
-            host=test_config_data.get("host", "http://localhost:8080"),
-            users=test_config_data.get("users", 1),
-            spawn_rate=test_config_data.get("spawn_rate", 1),
-            run_time=test_config_data.get("run_time", "1m"),
-            min_wait=test_config_data.get("min_wait", 1000),
-            max_wait=test_config_data.get("max_wait", 5000),
-            assertions=test_config_data.get("assertions", []),
-            extract_variables=test_config_data.get("extract_variables", {}),
-            headers=test_config_data.get("headers", {}),
-            params=test_config_data.get("params", {}),
-            body=test_config_data.get("body", {}),
-            output_dir=test_config_data.get("output_dir", "test_reports"),
-            generate_csv=test_config_data.get("generate_csv", True),
-            generate_html=test_config_data.get("generate_html", True),
-            log_level=test_config_data.get("log_level", "INFO")
-        )
+        config_fields = {field.name for field in fields(TestConfig)}
+        test_config_kwargs = {key: value for key, value in test_config_data.items() if key in config_fields}
+        test_config_kwargs.setdefault("scenario_name", scenario_config.get("name", "Unknown"))
+        test_config_kwargs.setdefault("host", "http://localhost:8080")
+        # The CLI has always sent an empty body rather than TestConfig's None
+        test_config_kwargs.setdefault("body", {})
+        test_config = TestConfig(**test_config_kwargs)
         
         # Initialize test agent
         logger.info("Initializing test agent")
@@ -89,6 +108,8 @@ def run_test_workflow(args):
         
         # Initialize LLM analyzer
         if args.use_llm:
+            from ..analysis.llm_analyzer import LLMAnalyzer, MockLLMAnalyzer
+
             if args.mock_llm:
                 logger.info("Using mock LLM analyzer")
                 llm_analyzer = MockLLMAnalyzer()
@@ -102,47 +123,55 @@ def run_test_workflow(args):
             
             # Perform LLM analysis
             logger.info("Performing LLM analysis")
-            llm_analysis = llm_analyzer.analyze_test_results(
-                workflow_result["test_result"],
-                workflow_result.get("html_report_path")
-            )
+            try:
+                llm_analysis = llm_analyzer.analyze_test_results(
+                    workflow_result["test_result"],
+                    workflow_result.get("html_report_path")
+                )
+            finally:
+                llm_analyzer.close()
             workflow_result["llm_analysis"] = llm_analysis
         
         # Save results
         if args.output_file:
-            save_results(workflow_result, args.output_file)
+            save_results(workflow_result, args.output_file, args.pretty)
         
         # Print summary
-        print("\n" + "="*60)
-        print("TEST WORKFLOW SUMMARY")
-        print("="*60)
-        print(f"Scenario: {workflow_result['scenario_name']}")
-        print(f"Success: {workflow_result['workflow_success']}")
-        print(f"Script: {workflow_result['script_path']}")
+        summary_lines = [
+            "\n" + "="*60,
+            "TEST WORKFLOW SUMMARY",
+            "="*60,
+            f"Scenario: {workflow_result['scenario_name']}",
+            f"Success: {workflow_result['workflow_success']}",
+            f"Script: {workflow_result['script_path']}"
+        ]
         
         if workflow_result.get("html_report_path"):
-            print(f"HTML Report: {workflow_result['html_report_path']}")
+            summary_lines.append(f"HTML Report: {workflow_result['html_report_path']}")
         
         if workflow_result.get("csv_report_path"):
-            print(f"CSV Report: {workflow_result['csv_report_path']}")
+            summary_lines.append(f"CSV Report: {workflow_result['csv_report_path']}")
         
         if workflow_result.get("llm_analysis"):
             analysis = workflow_result["llm_analysis"]
-            print(f"\nLLM Analysis:")
-            print(f"Performance Grade: {analysis.get('performance_grade', 'UNKNOWN')}")
-            print(f"Summary: {analysis.get('summary', 'No summary available')}")
+            summary_lines.append("\nLLM Analysis:")
+            summary_lines.append(f"Performance Grade: {analysis.get('performance_grade', 'UNKNOWN')}")
+            summary_lines.append(f"Summary: {analysis.get('summary', 'No summary available')}")
             
             if analysis.get("key_insights"):
-                print(f"\nKey Insights:")
-                for insight in analysis["key_insights"]:
-                    print(f"  • {insight}")
+                summary_lines.append("\nKey Insights:")
+                summary_lines.extend(f"  • {insight}" for insight in analysis["key_insights"])
             
             if analysis.get("recommendations"):
-                print(f"\nRecommendations:")
-                for rec in analysis["recommendations"]:
-                    print(f"  • {rec}")
+                summary_lines.append("\nRecommendations:")
+                summary_lines.extend(f"  • {rec}" for rec in analysis["recommendations"])
         
-        print("="*60)
+        summary_lines.append("="*60)
+        # Stopping the listener drains queued log records, so none land inside the summary
+        log_listener.stop()
+        sys.stdout.write("\n".join(summary_lines) + "\n")
+        sys.stdout.flush()
+        log_listener.start()
         
         # Exit with appropriate code
         if workflow_result['workflow_success']:
@@ -156,74 +185,72 @@ def run_test_workflow(args):
         sys.exit(1)
 
 
+SAMPLE_SCENARIO_CONFIG = {
+    "name": "Sample API Test",
+    "description": "A sample API test scenario",
+    "min_wait": 1000,
+    "max_wait": 5000,
+    "steps": [
+        {
+            "id": 1,
+            "type": "api_call",
+            "config": {
+                "name": "Get Users",
+                "method": "GET",
+                "url": "/api/users",
+                "headers": {
+                    "Content-Type": "application/json"
+                },
+                "params": {},
+                "body": None,
+                "extract": {
+                    "user_count": "$.total"
+                },
+                "assertions": [
+                    {
+                        "type": "status_code",
+                        "value": 200
+                    }
+                ]
+            }
+        }
+    ]
+}
+
+SAMPLE_TEST_CONFIG = {
+    "scenario_name": "Sample API Test",
+    "host": "https://api.example.com",
+    "users": 10,
+    "spawn_rate": 2,
+    "run_time": "5m",
+    "min_wait": 1000,
+    "max_wait": 5000,
+    "assertions": [
+        {
+            "type": "status_code",
+            "value": 200
+        }
+    ],
+    "extract_variables": {
+        "user_count": "$.total"
+    },
+    "headers": {
+        "Content-Type": "application/json"
+    },
+    "params": {},
+    "body": {},
+    "output_dir": "test_reports",
+    "generate_csv": True,
+    "generate_html": True,
+    "log_level": "INFO"
+}
+
+
 def create_sample_configs(args):
     """Create sample configuration files."""
-    scenario_config = {
-        "name": "Sample API Test",
-        "description": "A sample API test scenario",
-        "min_wait": 1000,
-        "max_wait": 5000,
-        "steps": [
-            {
-                "id": 1,
-                "type": "api_call",
-                "config": {
-                    "name": "Get Users",
-                    "method": "GET",
-                    "url": "/api/users",
-                    "headers": {
-                        "Content-Type": "application/json"
-                    },
-                    "params": {},
-                    "body": None,
-                    "extract": {
-                        "user_count": "$.total"
-                    },
-                    "assertions": [
-                        {
-                            "type": "status_code",
-                            "value": 200
-                        }
-                    ]
-                }
-            }
-        ]
-    }
-    
-    test_config = {
-        "scenario_name": "Sample API Test",
-        "host": "https://api.example.com",
-        "users": 10,
-        "spawn_rate": 2,
-        "run_time": "5m",
-        "min_wait": 1000,
-        "max_wait": 5000,
-        "assertions": [
-            {
-                "type": "status_code",
-                "value": 200
-            }
-        ],
-        "extract_variables": {
-            "user_count": "$.total"
-        },
-        "headers": {
-            "Content-Type": "application/json"
-        },
-        "params": {},
-        "body": {},
-        "output_dir": "test_reports",
-        "generate_csv": True,
-        "generate_html": True,
-        "log_level": "INFO"
-    }
-    
     # Save sample files
-    with open("sample_scenario_config.json", "w") as f:
-        json.dump(scenario_config, f, indent=2)
-    
-    with open("sample_test_config.json", "w") as f:
-        json.dump(test_config, f, indent=2)
+    Path("sample_scenario_config.json").write_bytes(json_dumps_indented(SAMPLE_SCENARIO_CONFIG) + b"\n")
+    Path("sample_test_config.json").write_bytes(json_dumps_indented(SAMPLE_TEST_CONFIG) + b"\n")
     
     print("Sample configuration files created:")
     print("  - sample_scenario_config.json")
@@ -263,6 +290,7 @@ Examples:
     run_parser.add_argument("--test-config", required=True, help="Path to test configuration JSON file")
     run_parser.add_argument("--workspace-dir", help="Workspace directory for scripts and reports")
     run_parser.add_argument("--output-file", help="Path to save results JSON file")
+    run_parser.add_argument("--pretty", action="store_true", help="Indent the results JSON file")
     run_parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     
     # LLM options